@@ -4,26 +4,32 @@ Exploration Configuration
 Configuration classes for different exploration strategies and behaviors.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from enum import Enum
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional, Any, Mapping, Sequence
+from enum import Enum, IntEnum
 
 
-class ExplorationStrategy(Enum):
-    """Available exploration strategies."""
+# Configs are immutable; __slots__ generation needs Python 3.10+
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+class ExplorationStrategy(str, Enum):
+    """Available exploration strategies (compare equal to their string values)."""
     SYSTEMATIC = "systematic"
     INTELLIGENT = "intelligent"
     HYBRID = "hybrid"
 
 
-class ActionPriority(Enum):
-    """Priority levels for different action types."""
+class ActionPriority(IntEnum):
+    """Priority levels for different action types; lower values sort first."""
     HIGH = 1
-    MEDIUM = 2  
+    MEDIUM = 2
     LOW = 3
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StrategyConfig:
     """Configuration for exploration strategies."""
     strategy: ExplorationStrategy = ExplorationStrategy.SYSTEMATIC
@@ -36,35 +42,39 @@ class StrategyConfig:
     action_delay: float = 1.0  # seconds between actions
 
 
-@dataclass
+# Element defaults are shared read-only by every ElementConfig; callers that
+# need different selectors pass their own tuple or dict
+DEFAULT_EXCLUDE_SELECTORS = (
+    '.advertisement',
+    '.cookie-banner',
+    '.tracking-pixel'
+)
+
+DEFAULT_PRIORITY_SELECTORS = MappingProxyType({
+    'button': ActionPriority.HIGH,
+    'input[type="submit"]': ActionPriority.HIGH,
+    'a.primary': ActionPriority.HIGH,
+    'input': ActionPriority.MEDIUM,
+    'select': ActionPriority.MEDIUM,
+    'a': ActionPriority.LOW
+})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ElementConfig:
     """Configuration for element discovery and interaction."""
     include_hidden: bool = False
     include_disabled: bool = False
     min_element_size: int = 10  # minimum width/height in pixels
-    exclude_selectors: List[str] = None
-    priority_selectors: Dict[str, ActionPriority] = None
-    
-    def __post_init__(self):
-        if self.exclude_selectors is None:
-            self.exclude_selectors = [
-                '.advertisement',
-                '.cookie-banner',
-                '.tracking-pixel'
-            ]
-        
-        if self.priority_selectors is None:
-            self.priority_selectors = {
-                'button': ActionPriority.HIGH,
-                'input[type="submit"]': ActionPriority.HIGH,
-                'a.primary': ActionPriority.HIGH,
-                'input': ActionPriority.MEDIUM,
-                'select': ActionPriority.MEDIUM,
-                'a': ActionPriority.LOW
-            }
-
-
-@dataclass
+    exclude_selectors: Sequence[str] = DEFAULT_EXCLUDE_SELECTORS
+    # Mappings are unhashable, so this field is compared but left out of __hash__
+    priority_selectors: Mapping[str, ActionPriority] = field(
+        default_factory=lambda: DEFAULT_PRIORITY_SELECTORS,
+        hash=False
+    )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TimeoutConfig:
     """Configuration for various timeouts."""
     navigation_timeout: int = 30000  # milliseconds
@@ -73,12 +83,12 @@ class TimeoutConfig:
     page_load_timeout: int = 60000
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExplorationConfig:
     """Main exploration configuration."""
-    strategy: StrategyConfig = None
-    elements: ElementConfig = None
-    timeouts: TimeoutConfig = None
+    strategy: StrategyConfig = field(default_factory=StrategyConfig)
+    elements: ElementConfig = field(default_factory=ElementConfig)
+    timeouts: TimeoutConfig = field(default_factory=TimeoutConfig)
     
     # Global limits
     max_total_actions: int = 500
@@ -94,14 +104,6 @@ class ExplorationConfig:
     parallel_execution: bool = False
     batch_size: int = 5
     
-    def __post_init__(self):
-        if self.strategy is None:
-            self.strategy = StrategyConfig()
-        if self.elements is None:
-            self.elements = ElementConfig()
-        if self.timeouts is None:
-            self.timeouts = TimeoutConfig()
-            
     @classmethod
     def for_systematic_exploration(cls) -> 'ExplorationConfig':
         """Create config optimized for systematic exploration."""
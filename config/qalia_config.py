@@ -5,20 +5,121 @@ This module handles parsing qalia.yml configuration files and managing
 application deployment for testing.
 """
 
+import asyncio
 import yaml
+import orjson
+import hashlib
 import os
+import shlex
 import subprocess
 import time
-import requests
+import httpx
 import tempfile
 import shutil
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
+from functools import lru_cache
 from pathlib import Path
 import socket
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+
+# Readiness polling starts fast so quick servers are picked up almost
+# immediately, then backs off for slow builds
+READY_POLL_INITIAL_DELAY = 0.05
+READY_POLL_MAX_DELAY = 1.0
+READY_REQUEST_TIMEOUT = 2.0
+
+# Commands using any of these need /bin/sh; everything else is split with
+# shlex and executed directly, which lets subprocess use posix_spawn
+SHELL_METACHARACTERS = frozenset("|&;<>()$`*?[]~#\n")
+
+# Builtins that only exist inside a shell (some systems also ship e.g. a
+# /usr/bin/cd that cannot affect the commands after it)
+SHELL_BUILTINS = frozenset({
+    ".", "alias", "cd", "command", "eval", "exec", "export", "popd", "pushd",
+    "read", "set", "shift", "source", "trap", "ulimit", "umask", "unset"
+})
+
+# Optional directory for parsed qalia.yml files kept as JSON across restarts;
+# only used when set, since the server must be able to trust what it reads back
+QALIA_CACHE_DIR = os.getenv("QALIA_CACHE_DIR")
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml(content: bytes) -> Any:
+    """
+    Parse YAML content, memoized by the raw bytes.
+
+    Every webhook checks the repository out to a fresh directory, so the
+    cache is keyed on file content rather than path; an unchanged qalia.yml
+    is only parsed once per process. Callers must not mutate the result.
+    """
+    if not QALIA_CACHE_DIR:
+        return yaml.load(content, Loader=YamlSafeLoader)
+
+    cache_path = Path(QALIA_CACHE_DIR) / f"{hashlib.sha256(content).hexdigest()}.json"
+    try:
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    data = yaml.load(content, Loader=YamlSafeLoader)
+    _write_json_cache(cache_path, data)
+    return data
+
+
+def _write_json_cache(cache_path: Path, data: Any) -> None:
+    """Atomically store parsed YAML as JSON, skipping data JSON cannot round-trip."""
+    try:
+        encoded = orjson.dumps(data)
+        # Dates and non-string keys would come back changed
+        if orjson.loads(encoded) != data:
+            return
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Could not cache parsed config at {cache_path}: {e}")
+
+def _command_args(command: str) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Prepare a qalia.yml command for subprocess.
+    
+    Returns:
+        Tuple of (args, shell): an argv list when the command runs a single
+        executable, or the original string with shell=True when it uses shell
+        operators, builtins or variable assignments, or names no program on PATH
+    """
+    if os.name != "posix" or not SHELL_METACHARACTERS.isdisjoint(command):
+        return command, True
+    
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return command, True
+    
+    # Leading NAME=value assignments are only understood by the shell
+    if not args or "=" in args[0] or args[0] in SHELL_BUILTINS:
+        return command, True
+    
+    # Paths are resolved against the command's cwd; bare names must be on PATH,
+    # otherwise let the shell report (or resolve) them as before
+    if os.sep not in args[0] and shutil.which(args[0]) is None:
+        return command, True
+    
+    return args, False
+
 class QaliaConfig:
     """Handles qalia.yml configuration parsing and validation."""
     
@@ -30,8 +131,7 @@ class QaliaConfig:
     def load_config(self):
         """Load and parse the qalia.yml configuration file."""
         try:
-            with open(self.config_path, 'r') as file:
-                self.config = yaml.safe_load(file)
+            self.config = _parse_yaml(Path(self.config_path).read_bytes())
             logger.info(f"Loaded configuration from {self.config_path}")
         except FileNotFoundError:
             logger.warning(f"No {self.config_path} found, using defaults")
@@ -127,7 +227,8 @@ class DeploymentManager:
         logger.info(f"Starting application with command: {startup_command}")
         
         # Start the application
-        self.process = subprocess.Popen(startup_command, shell=True, cwd=self.repo_path)
+        args, shell = _command_args(startup_command)
+        self.process = subprocess.Popen(args, shell=shell, cwd=self.repo_path)
         
         # Wait for server to be ready
         url = f"http://localhost:{port}"
@@ -135,43 +236,55 @@ class DeploymentManager:
         return url
     
     def _find_available_port(self, preferred_port: int) -> int:
-        """Find an available port starting from preferred_port."""
-        for port in range(preferred_port, preferred_port + 100):
+        """Return preferred_port if it is free, otherwise a free port chosen by the OS."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                    logger.info(f"Found available port: {port}")
-                    return port
+                s.bind(('localhost', preferred_port))
             except OSError:
-                continue
+                # Let the kernel pick an unused ephemeral port in one bind
+                # instead of probing the ports after preferred_port one by one
+                try:
+                    s.bind(('localhost', 0))
+                except OSError as e:
+                    raise RuntimeError(f"No available port found: {e}") from e
+            
+            port = s.getsockname()[1]
         
-        # If no port found in range, raise error
-        raise RuntimeError(f"No available ports found in range {preferred_port}-{preferred_port + 100}")
+        logger.info(f"Found available port: {port}")
+        return port
     
     async def _run_build_commands(self):
         """Run build commands specified in configuration."""
         build_commands = self.deployment_config.get("build", [])
         for cmd in build_commands:
             logger.info(f"Running build command: {cmd}")
-            result = subprocess.run(cmd, shell=True, cwd=self.repo_path)
+            args, shell = _command_args(cmd)
+            try:
+                result = subprocess.run(args, shell=shell, cwd=self.repo_path)
+            except OSError as e:
+                raise RuntimeError(f"Build command failed: {cmd}") from e
             if result.returncode != 0:
                 raise RuntimeError(f"Build command failed: {cmd}")
     
     async def _wait_for_ready(self, url: str, timeout: int = 30):
-        """Wait for the application to be ready."""
+        """Wait for the application to be ready, polling with exponential backoff."""
         health_check_url = self.deployment_config.get("start", {}).get("health_check", url)
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                response = requests.get(health_check_url, timeout=5)
-                if response.status_code == 200:
-                    logger.info(f"Application ready at {url}")
-                    return
-            except requests.RequestException:
-                pass
-            
-            time.sleep(2)
+        deadline = time.monotonic() + timeout
+        delay = READY_POLL_INITIAL_DELAY
+        async with httpx.AsyncClient(timeout=READY_REQUEST_TIMEOUT) as client:
+            while time.monotonic() < deadline:
+                try:
+                    # Only the status matters; stream so the page body is never downloaded
+                    async with client.stream("GET", health_check_url) as response:
+                        if response.status_code == 200:
+                            logger.info(f"Application ready at {url}")
+                            return
+                except httpx.HTTPError:
+                    pass
+                
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, READY_POLL_MAX_DELAY)
         
         raise TimeoutError(f"Application not ready after {timeout} seconds")
     
@@ -18,10 +18,14 @@ setup(
         # GitHub App dependencies
         "fastapi>=0.109.2",
         "uvicorn>=0.27.1",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
+        "httptools>=0.6.1",
         "PyGithub>=2.1.1",
         "PyJWT>=2.8.0",
+        "cryptography>=41.0.0",
         "aiofiles>=23.2.1",
-        "httpx>=0.25.2",
+        "httpx[http2]>=0.25.2",
+        "orjson>=3.9.0",
     ],
     entry_points={
         "console_scripts": [
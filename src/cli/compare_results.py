@@ -3,51 +3,59 @@
 Compare enhanced rich state detection results with original session
 """
 
+import sys
+
+# The report is static, so it is assembled once and written in a single call
+COMPARISON_REPORT = "\n".join([
+    "🚀 RICH STATE DETECTION SUCCESS COMPARISON",
+    "=" * 60,
+    "",
+    "📊 ORIGINAL SESSION (defi_space_20250610_120829):",
+    "   • Duration: 137.6s",
+    "   • Actions: 36",
+    "   • Success Rate: 97.2%",
+    "   • Issues: 1 timeout on 'discやrd' element",
+    "   • Analysis: Simple timeout-based success detection",
+    "",
+    "🌟 ENHANCED SESSION (Today's Run):",
+    "   • Duration: ~180s (slightly longer due to comprehensive analysis)",
+    "   • Actions: 36",
+    "   • Success Rate: 100.0%",
+    "   • Issues: 0 timeouts, 2 elements with no state changes detected",
+    "   • Analysis: Rich state detection with comprehensive change tracking",
+    "",
+    "🔍 RICH STATE DETECTION FEATURES ADDED:",
+    "   ✅ DOM structure change detection",
+    "   ✅ Content modification tracking",
+    "   ✅ Modal/dialog state monitoring",
+    "   ✅ CSS class change detection",
+    "   ✅ ARIA state tracking",
+    "   ✅ Form value monitoring",
+    "   ✅ Navigation change detection",
+    "   ✅ Confidence scoring for success assessment",
+    "",
+    "🎯 KEY IMPROVEMENTS:",
+    "   • No more false negative timeouts",
+    "   • Intelligent success assessment beyond URL changes",
+    "   • Comprehensive state change documentation",
+    "   • Enhanced XML reports for ChatGPT analysis",
+    "   • Better detection of functional vs broken elements",
+    "",
+    "📈 PERFORMANCE IMPACT:",
+    "   • More accurate bug detection",
+    "   • Fewer false positive reports",
+    "   • Richer data for AI analysis",
+    "   • Better understanding of element behavior",
+    "",
+    "✅ CONCLUSION:",
+    "   Rich state detection successfully eliminates the core issue",
+    "   of incorrect success/failure assessment that was causing",
+    "   ChatGPT to receive inaccurate bug reports.",
+])
+
+
 def print_comparison():
-    print("🚀 RICH STATE DETECTION SUCCESS COMPARISON")
-    print("=" * 60)
-    
-    print("\n📊 ORIGINAL SESSION (defi_space_20250610_120829):")
-    print("   • Duration: 137.6s")
-    print("   • Actions: 36") 
-    print("   • Success Rate: 97.2%")
-    print("   • Issues: 1 timeout on 'discやrd' element")
-    print("   • Analysis: Simple timeout-based success detection")
-    
-    print("\n🌟 ENHANCED SESSION (Today's Run):")
-    print("   • Duration: ~180s (slightly longer due to comprehensive analysis)")
-    print("   • Actions: 36")
-    print("   • Success Rate: 100.0%")
-    print("   • Issues: 0 timeouts, 2 elements with no state changes detected")
-    print("   • Analysis: Rich state detection with comprehensive change tracking")
-    
-    print("\n🔍 RICH STATE DETECTION FEATURES ADDED:")
-    print("   ✅ DOM structure change detection")
-    print("   ✅ Content modification tracking")
-    print("   ✅ Modal/dialog state monitoring") 
-    print("   ✅ CSS class change detection")
-    print("   ✅ ARIA state tracking")
-    print("   ✅ Form value monitoring")
-    print("   ✅ Navigation change detection")
-    print("   ✅ Confidence scoring for success assessment")
-    
-    print("\n🎯 KEY IMPROVEMENTS:")
-    print("   • No more false negative timeouts")
-    print("   • Intelligent success assessment beyond URL changes")
-    print("   • Comprehensive state change documentation")
-    print("   • Enhanced XML reports for ChatGPT analysis")
-    print("   • Better detection of functional vs broken elements")
-    
-    print("\n📈 PERFORMANCE IMPACT:")
-    print("   • More accurate bug detection")
-    print("   • Fewer false positive reports") 
-    print("   • Richer data for AI analysis")
-    print("   • Better understanding of element behavior")
-    
-    print("\n✅ CONCLUSION:")
-    print("   Rich state detection successfully eliminates the core issue")
-    print("   of incorrect success/failure assessment that was causing") 
-    print("   ChatGPT to receive inaccurate bug reports.")
+    sys.stdout.write(COMPARISON_REPORT + "\n")
 
 if __name__ == "__main__":
     print_comparison() 
\ No newline at end of file
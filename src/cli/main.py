@@ -25,18 +25,34 @@ from scripts.run_exploration import run_exploration
 from src.qalia.generators import TestCaseGenerator
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('qalia_complete_session.log')
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def configure_logging():
+    """Configure CLI logging; done in main() so importing this module leaves logging alone."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler('qalia_complete_session.log')
+        ]
+    )
+
+# Playwright browsers are shared by every test run, so install them at most once per process
+_playwright_browsers_installed = False
+
+# Top-level files that suggest a repository contains a web application
+WEB_APP_INDICATORS = frozenset({
+    "package.json",
+    "index.html",
+    "app.py",
+    "requirements.txt",
+    "Dockerfile",
+    "docker-compose.yml"
+})
+
+
 def print_banner():
     """Print the unified QA AI banner."""
     print("""
@@ -309,7 +325,9 @@ async def analyze_web_app(repo_path: str, installation_id: int = None) -> Dict[s
     Analyze a web application repository and generate tests.
     
     This is the main entry point used by the GitHub integration (app.py).
-    It runs the complete pipeline on a cloned repository.
+    It runs the complete pipeline on a cloned repository. Test generation is
+    synchronous file and CPU work, so it runs in a worker thread to keep the
+    server's event loop free for other webhooks.
     
     Args:
         repo_path: Path to the cloned repository
@@ -318,27 +336,20 @@ async def analyze_web_app(repo_path: str, installation_id: int = None) -> Dict[s
     Returns:
         Analysis results including test frameworks and output directories
     """
+    return await asyncio.to_thread(_analyze_repository, repo_path, installation_id)
+
+
+def _analyze_repository(repo_path: str, installation_id: int = None) -> Dict[str, Any]:
+    """Run the repository-based analysis behind analyze_web_app()."""
     try:
         logger.info(f"🔍 Starting web app analysis for repository: {repo_path}")
         
-        # Change to the repository directory
-        original_cwd = os.getcwd()
-        os.chdir(repo_path)
+        # List the repository root once instead of stat-ing each candidate file
+        with os.scandir(repo_path) as entries:
+            root_files = {entry.name for entry in entries}
         
         # Try to detect if this is a web application
-        web_indicators = [
-            "package.json",
-            "index.html", 
-            "app.py",
-            "requirements.txt",
-            "Dockerfile",
-            "docker-compose.yml"
-        ]
-        
-        has_web_indicators = any(
-            os.path.exists(os.path.join(repo_path, indicator)) 
-            for indicator in web_indicators
-        )
+        has_web_indicators = not WEB_APP_INDICATORS.isdisjoint(root_files)
         
         if not has_web_indicators:
             logger.warning("No clear web application indicators found, proceeding anyway...")
@@ -347,14 +358,14 @@ async def analyze_web_app(repo_path: str, installation_id: int = None) -> Dict[s
         base_url = "http://localhost:3000"  # Default assumption
         
         # Check for common port configurations
-        if os.path.exists("package.json"):
+        if "package.json" in root_files:
             try:
-                with open("package.json", 'r') as f:
-                    package_data = json.load(f)
-                    scripts = package_data.get("scripts", {})
-                    # Look for common development server patterns
-                    if "dev" in scripts or "start" in scripts:
-                        base_url = "http://localhost:3000"  # React/Next.js default
+                # json.loads detects the encoding itself, so skip the text-mode decode
+                package_data = json.loads((Path(repo_path) / "package.json").read_bytes())
+                scripts = package_data.get("scripts", {})
+                # Look for common development server patterns
+                if "dev" in scripts or "start" in scripts:
+                    base_url = "http://localhost:3000"  # React/Next.js default
             except:
                 pass
         
@@ -447,17 +458,12 @@ async def analyze_web_app(repo_path: str, installation_id: int = None) -> Dict[s
             'repository_path': repo_path,
             'installation_id': installation_id
         }
-    
-    finally:
-        # Restore original working directory
-        try:
-            os.chdir(original_cwd)
-        except:
-            pass
 
 
 async def _run_framework_tests(framework: str, framework_dir: Path) -> Dict[str, Any]:
     """Run tests for a specific framework."""
+    global _playwright_browsers_installed
+    
     result = {
         'framework': framework,
         'success': False,
@@ -503,14 +509,17 @@ async def _run_framework_tests(framework: str, framework_dir: Path) -> Dict[str,
                 result['error'] = f"npm install failed: {install_result.stderr}"
                 return result
                 
-            # Install Playwright browsers (with timeout)
-            browser_install = subprocess.run(
-                ['npx', 'playwright', 'install', '--with-deps'], 
-                cwd=framework_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=300  # 5 minutes timeout
-            )
+            # Install Playwright browsers (with timeout) unless an earlier run already did;
+            # the installer itself is a quick no-op when the required revisions are present
+            if not _playwright_browsers_installed:
+                browser_install = subprocess.run(
+                    ['npx', 'playwright', 'install', '--with-deps'], 
+                    cwd=framework_dir, 
+                    capture_output=True, 
+                    text=True, 
+                    timeout=300  # 5 minutes timeout
+                )
+                _playwright_browsers_installed = browser_install.returncode == 0
             
         elif framework == 'cypress':
             install_result = subprocess.run(
@@ -611,6 +620,8 @@ async def _run_framework_tests(framework: str, framework_dir: Path) -> Dict[str,
 
 def main():
     """Main entry point for the complete QA AI pipeline."""
+    configure_logging()
+    
     parser = argparse.ArgumentParser(
         description='QA AI - Complete Testing Pipeline (Exploration → Test Generation)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
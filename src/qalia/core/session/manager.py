@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 from datetime import datetime
@@ -5,6 +6,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 import json
+import re
+from collections import Counter
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -12,6 +16,24 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Severity keywords counted in ChatGPT responses, matched in a single pass
+SEVERITY_RE = re.compile(r"critical|high|medium|low")
+
+# Reports are indented like json.dump(indent=2); dataclasses and datetimes are
+# passed through to default=str so they serialize exactly as before
+JSON_REPORT_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def _write_json_report(path: Path, data: Any) -> None:
+    """Write data to path as indented UTF-8 JSON."""
+    path.write_bytes(orjson.dumps(data, default=str, option=JSON_REPORT_OPTIONS))
+
+
 class SessionManager:
     """
     Manages exploration sessions including directory creation and file organization.
@@ -177,14 +199,14 @@ class SessionManager:
             }
         }
         
-        # Save JSON report
+        # Save JSON report; the report holds every discovered element and
+        # action, so serializing and writing it runs off the event loop
         report_path = self.session_dir / "reports" / "session_report.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        await asyncio.to_thread(_write_json_report, report_path, report)
         
         # Save human-readable summary
         summary_path = self.session_dir / "reports" / "session_summary.txt"
-        self._save_human_readable_summary(report, summary_path)
+        await asyncio.to_thread(self._save_human_readable_summary, report, summary_path)
         
         # Generate and save detailed action analysis XML for ChatGPT
         analysis_xml = self.generate_detailed_action_analysis_xml(exploration_results)
@@ -201,8 +223,7 @@ class SessionManager:
             raise RuntimeError(f"❌ CRITICAL: Generated XML is malformed: {e}")
         
         analysis_xml_path = self.session_dir / "reports" / "action_analysis_for_chatgpt.xml"
-        with open(analysis_xml_path, 'w', encoding='utf-8') as f:
-            f.write(analysis_xml)
+        await asyncio.to_thread(analysis_xml_path.write_text, analysis_xml, encoding='utf-8')
         logger.info(f"🤖 ChatGPT analysis XML saved: {analysis_xml_path}")
         
         # Attempt structured test generation with graceful degradation
@@ -239,8 +260,7 @@ class SessionManager:
                 logger.info(f"📋 Session report will continue without test generation")
         
         # Re-save the report with ChatGPT analysis info
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        await asyncio.to_thread(_write_json_report, report_path, report)
         
         logger.info(f"📋 Session report saved: {report_path}")
         logger.info(f"📁 POST-EXPLORATION: Session reporting complete - {len(exploration_results.get('detailed_results', {}).get('executed_actions', []))} actions processed into reports")
@@ -904,7 +924,11 @@ class SessionManager:
             raise RuntimeError(f"❌ CRITICAL: Failed to load system prompt from {system_prompt_file}: {e}")
     
     async def _save_chatgpt_analysis(self, chatgpt_response: str, exploration_results: Dict[str, Any]) -> list[str]:
-        """Save ChatGPT analysis in multiple formats."""
+        """Save ChatGPT analysis in multiple formats without blocking the event loop on disk I/O."""
+        return await asyncio.to_thread(self._write_chatgpt_analysis, chatgpt_response, exploration_results)
+    
+    def _write_chatgpt_analysis(self, chatgpt_response: str, exploration_results: Dict[str, Any]) -> list[str]:
+        """Write the raw, JSON and Markdown ChatGPT reports."""
         
         saved_files = []
         timestamp = datetime.now().isoformat()
@@ -923,8 +947,7 @@ class SessionManager:
         # 2. Save structured JSON analysis
         structured_analysis = self._parse_chatgpt_response(chatgpt_response, exploration_results)
         json_file = self.session_dir / "reports" / "chatgpt_bug_analysis.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(structured_analysis, f, indent=2, default=str)
+        _write_json_report(json_file, structured_analysis)
         saved_files.append(str(json_file))
         
         # 3. Save formatted Markdown report
@@ -938,6 +961,9 @@ class SessionManager:
     
     def _parse_chatgpt_response(self, response: str, exploration_results: Dict[str, Any]) -> Dict[str, Any]:
         """Parse ChatGPT response into structured data."""
+        # Lowercase once and reuse it for every keyword check below
+        response_lower = response.lower()
+        severity_counts = Counter(SEVERITY_RE.findall(response_lower))
         
         return {
             "analysis_metadata": {
@@ -951,25 +977,25 @@ class SessionManager:
             "chatgpt_analysis": {
                 "raw_response": response,
                 "analysis_length": len(response),
-                "contains_bug_reports": "bug" in response.lower() or "issue" in response.lower(),
-                "contains_recommendations": "recommend" in response.lower() or "suggest" in response.lower(),
+                "contains_bug_reports": "bug" in response_lower or "issue" in response_lower,
+                "contains_recommendations": "recommend" in response_lower or "suggest" in response_lower,
                 "severity_mentions": {
-                    "critical": response.lower().count("critical"),
-                    "high": response.lower().count("high"),
-                    "medium": response.lower().count("medium"), 
-                    "low": response.lower().count("low")
+                    "critical": severity_counts["critical"],
+                    "high": severity_counts["high"],
+                    "medium": severity_counts["medium"],
+                    "low": severity_counts["low"]
                 }
             },
             "automated_flags": {
-                "potential_bugs_detected": len([line for line in response.split('\n') if 'bug' in line.lower()]),
-                "performance_issues_mentioned": 'performance' in response.lower() or 'slow' in response.lower(),
-                "navigation_issues_mentioned": 'navigation' in response.lower() or 'link' in response.lower(),
-                "requires_developer_attention": any(word in response.lower() for word in ['critical', 'high', 'bug', 'broken', 'error']),
+                "potential_bugs_detected": len([line for line in response_lower.split('\n') if 'bug' in line]),
+                "performance_issues_mentioned": 'performance' in response_lower or 'slow' in response_lower,
+                "navigation_issues_mentioned": 'navigation' in response_lower or 'link' in response_lower,
+                "requires_developer_attention": any(word in response_lower for word in ['critical', 'high', 'bug', 'broken', 'error']),
                 "analysis_confidence": "high" if len(response) > 500 else "medium"
             },
             "next_steps": {
                 "requires_manual_review": True,
-                "priority_level": "high" if any(word in response.lower() for word in ['critical', 'broken']) else "medium",
+                "priority_level": "high" if any(word in response_lower for word in ['critical', 'broken']) else "medium",
                 "estimated_review_time": "15-30 minutes"
             }
         }
@@ -1036,7 +1062,6 @@ class SessionManager:
         # Check for LLM typo analysis results first
         if llm_typo_file.exists():
             try:
-                import json
                 with open(llm_typo_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     
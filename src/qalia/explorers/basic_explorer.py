@@ -25,11 +25,6 @@ from utils import (
 from utils.typo_detector import TypoDetector
 from core import SessionManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -179,10 +174,25 @@ class CleanWebExplorer:
             # Debug: Check what elements are actually on the page
             try:
                 page = self.browser_manager.page
-                all_buttons = await page.locator('button').count()
-                all_inputs = await page.locator('input').count()
-                all_links = await page.locator('a').count()
-                all_divs_with_click = await page.locator('div[onclick], span[onclick], [role="button"]').count()
+                # The counts are independent reads, so issue them concurrently
+                (
+                    all_buttons, all_inputs, all_links, all_divs_with_click,
+                    visible_buttons, visible_inputs, visible_links,
+                    react_buttons, clickable_elements
+                ) = await asyncio.gather(*(
+                    page.locator(selector).count() for selector in (
+                        'button',
+                        'input',
+                        'a',
+                        'div[onclick], span[onclick], [role="button"]',
+                        'button:visible',
+                        'input:visible',
+                        'a:visible',
+                        # More specific selectors that modern apps might use
+                        '[class*="button"], [class*="btn"]',
+                        '[onclick], [data-testid], [data-cy]'
+                    )
+                ))
                 
                 logger.info(f"🔍 DEBUG - Found on page:")
                 logger.info(f"   • button tags: {all_buttons}")
@@ -191,17 +201,10 @@ class CleanWebExplorer:
                 logger.info(f"   • clickable divs/spans: {all_divs_with_click}")
                 
                 # Check visibility
-                visible_buttons = await page.locator('button:visible').count()
-                visible_inputs = await page.locator('input:visible').count() 
-                visible_links = await page.locator('a:visible').count()
-                
                 logger.info(f"   • visible buttons: {visible_buttons}")
                 logger.info(f"   • visible inputs: {visible_inputs}")
                 logger.info(f"   • visible links: {visible_links}")
                 
-                # Try more specific selectors that modern apps might use
-                react_buttons = await page.locator('[class*="button"], [class*="btn"]').count()
-                clickable_elements = await page.locator('[onclick], [data-testid], [data-cy]').count()
                 logger.info(f"   • CSS class buttons: {react_buttons}")
                 logger.info(f"   • Elements with click handlers: {clickable_elements}")
                 
@@ -295,6 +298,8 @@ class CleanWebExplorer:
         
         # Initialize BFS queue: (url, depth, parent_url)
         exploration_queue = deque([(self.base_url, 0, None)])
+        # Membership is tracked by clean_url() key; pages are opened by their original URL
+        queued_urls = {self.navigation_utils.clean_url(self.base_url)}  # Every URL ever queued
         visited_for_exploration = set()  # Track URLs we've fully explored
         max_depth = self.config.max_depth  # Use configurable depth limit
         
@@ -306,20 +311,21 @@ class CleanWebExplorer:
             
             # Check depth limit
             if depth > max_depth:
-                logger.info(f"🛑 Reached max depth ({max_depth}) for URL: {current_url}")
+                logger.info("🛑 Reached max depth (%s) for URL: %s", max_depth, current_url)
                 continue
                 
             # Skip if already fully explored
-            if current_url in visited_for_exploration:
+            current_key = self.navigation_utils.clean_url(current_url)
+            if current_key in visited_for_exploration:
                 continue
                 
-            logger.info(f"🔍 BFS Level {depth}: Exploring {current_url}")
+            logger.info("🔍 BFS Level %s: Exploring %s", depth, current_url)
             
             # Navigate to the page
             if current_url != self.browser_manager.get_current_url():
                 success = await self.browser_manager.navigate(current_url)
                 if not success:
-                    logger.warning(f"⚠️ Failed to navigate to {current_url}")
+                    logger.warning("⚠️ Failed to navigate to %s", current_url)
                     continue
                     
                 # Wait for page to load
@@ -332,7 +338,7 @@ class CleanWebExplorer:
             self.discovered_elements.extend(elements)
             
             # Perform typo detection on current page
-            logger.info(f"🔤 Analyzing page text for word candidates...")
+            logger.info("🔤 Analyzing page text for word candidates...")
             try:
                 page_text_data = await self.typo_detector.extract_page_text(
                     self.browser_manager.page
@@ -340,20 +346,20 @@ class CleanWebExplorer:
                 typo_report = self.typo_detector.analyze_text_for_typos(page_text_data)
                 
                 if typo_report.candidate_words_found > 0:
-                    logger.info(f"   📝 Found {typo_report.candidate_words_found} word candidates on {current_url}")
-                    logger.info(f"   📊 Total unique candidates: {len(self.typo_detector.word_candidates)}")
+                    logger.info("   📝 Found %s word candidates on %s", typo_report.candidate_words_found, current_url)
+                    logger.info("   📊 Total unique candidates: %s", len(self.typo_detector.word_candidates))
                 else:
-                    logger.info(f"   ✅ No unknown words found on {current_url}")
+                    logger.info("   ✅ No unknown words found on %s", current_url)
                     
             except Exception as e:
-                logger.warning(f"   ❌ Word analysis failed: {e}")
+                logger.warning("   ❌ Word analysis failed: %s", e)
             
             if not elements:
-                logger.info(f"   📋 No interactive elements found on {current_url}")
-                visited_for_exploration.add(current_url)
+                logger.info("   📋 No interactive elements found on %s", current_url)
+                visited_for_exploration.add(current_key)
                 continue
                 
-            logger.info(f"   📋 Found {len(elements)} interactive elements")
+            logger.info("   📋 Found %s interactive elements", len(elements))
             
             # Prioritize elements
             prioritized_elements = self._prioritize_elements(elements)
@@ -375,14 +381,17 @@ class CleanWebExplorer:
             # Handle any URLs discovered during exhaustive testing
             if hasattr(self, '_discovered_urls') and self._discovered_urls:
                 for discovered_url in self._discovered_urls:
-                    if discovered_url not in visited_for_exploration:
+                    # URLs differing only in anchor, trailing slash or query order are the same page
+                    url_key = self.navigation_utils.clean_url(discovered_url)
+                    if url_key not in visited_for_exploration:
                         # Only add to queue if it's the same domain (prevent internet crawling)
                         if self._is_same_domain(discovered_url, self.base_url):
-                            if discovered_url not in [item[0] for item in exploration_queue]:
+                            if url_key not in queued_urls:
+                                queued_urls.add(url_key)
                                 exploration_queue.append((discovered_url, depth + 1, current_url))
-                                logger.info(f"   🆕 Queued for exploration: {discovered_url} (depth {depth + 1})")
+                                logger.info("   🆕 Queued for exploration: %s (depth %s)", discovered_url, depth + 1)
                         else:
-                            logger.info(f"   🚫 Skipping external domain: {discovered_url}")
+                            logger.info("   🚫 Skipping external domain: %s", discovered_url)
                         
                         # Track as visited regardless of domain (for statistics)
                         if discovered_url not in self.visited_urls:
@@ -390,10 +399,10 @@ class CleanWebExplorer:
             
             # Progress reporting
             if total_actions % 10 == 0:
-                logger.info(f"   📊 Global Progress: {total_actions} actions, {total_successful} successful")
+                logger.info("   📊 Global Progress: %s actions, %s successful", total_actions, total_successful)
             
             # Mark this page as fully explored
-            visited_for_exploration.add(current_url)
+            visited_for_exploration.add(current_key)
             
             # Page completion summary with accurate coverage reporting
             page_success_rate = (page_successful / page_actions) if page_actions > 0 else 0
@@ -404,20 +413,20 @@ class CleanWebExplorer:
             
             # Show queue status
             if exploration_queue:
-                logger.info(f"   📋 Queue status: {len(exploration_queue)} pages remaining")
+                logger.info("   📋 Queue status: %s pages remaining", len(exploration_queue))
         
         # Final BFS summary
         final_success_rate = (total_successful / total_actions) if total_actions > 0 else 0
-        logger.info(f"🌊 BFS exploration complete:")
-        logger.info(f"   • Pages explored: {len(visited_for_exploration)}")
-        logger.info(f"   • Total actions: {total_actions}")
-        logger.info(f"   • Successful actions: {total_successful}")
+        logger.info("🌊 BFS exploration complete:")
+        logger.info("   • Pages explored: %s", len(visited_for_exploration))
+        logger.info("   • Total actions: %s", total_actions)
+        logger.info("   • Successful actions: %s", total_successful)
         logger.info(f"   • Overall success rate: {final_success_rate:.1%}")
-        logger.info(f"   • Queue remaining: {len(exploration_queue)} pages")
+        logger.info("   • Queue remaining: %s pages", len(exploration_queue))
     
     async def _explore_new_page(self, url: str) -> None:
         """Briefly explore a new page that was discovered."""
-        logger.info(f"🔎 Briefly exploring new page: {url}")
+        logger.info("🔎 Briefly exploring new page: %s", url)
         
         try:
             # Capture state
@@ -431,10 +440,10 @@ class CleanWebExplorer:
             )
             self.discovered_elements.extend(new_elements)
             
-            logger.info(f"📋 Found {len(new_elements)} elements on new page")
+            logger.info("📋 Found %s elements on new page", len(new_elements))
             
         except Exception as e:
-            logger.debug(f"Error exploring new page: {e}")
+            logger.debug("Error exploring new page: %s", e)
     
     async def _handle_action_error(self, action: Dict[str, Any], element: Dict[str, Any], error: str) -> None:
         """Handle action execution errors."""
@@ -452,7 +461,7 @@ class CleanWebExplorer:
         # Calculate metrics
         total_elements = len(self.discovered_elements)
         total_actions = len(self.executed_actions)
-        successful_actions = sum(1 for a in self.executed_actions if a.success)
+        successful_actions = sum(a.success for a in self.executed_actions)
         success_rate = successful_actions / total_actions if total_actions > 0 else 0
         
         # Get typo detection summary and perform LLM analysis if candidates found
@@ -475,6 +484,10 @@ class CleanWebExplorer:
                 logger.warning(f"❌ LLM analysis failed: {e}")
                 typo_summary['llm_analysis_completed'] = False
         
+        # Every action record shares the current URL and compile time, so read them once
+        current_url = self.browser_manager.get_current_url()
+        compiled_at = time.time()
+        
         results = {
             'status': 'completed',
             'base_url': self.base_url,
@@ -497,37 +510,7 @@ class CleanWebExplorer:
             'detailed_results': {
                 'discovered_elements': self.discovered_elements,
                 'executed_actions': [
-                    {
-                        'success': a.success,
-                        'action_type': a.action_type,
-                        'element_type': a.element_info.get('type', 'unknown'),
-                        'selector': a.element_info.get('selector', 'unknown'),
-                        'text': a.element_info.get('text', ''),
-                        'duration': a.duration,
-                        'error': a.error_message,
-                        'url': self.browser_manager.get_current_url(),
-                        'timestamp': time.time(),
-                        
-                        # Rich state detection data
-                        'state_changes': [change.__dict__ if hasattr(change, '__dict__') else change for change in (a.state_changes or [])],
-                        'success_assessment': a.success_assessment,
-                        'baseline_state': a.baseline_state,
-                        'final_state': a.final_state,
-                        
-                        # Enhanced context for XML analysis
-                        'url_changed': any(getattr(change, 'change_type', None) == 'navigation' for change in (a.state_changes or [])),
-                        'state_changed': len(a.state_changes or []) > 0,
-                        'navigation_occurred': any(getattr(change, 'category', None) == 'url_change' for change in (a.state_changes or [])),
-                        
-                        # Legacy format compatibility
-                        'action': {
-                            'action': a.action_type,
-                            'element_type': a.element_info.get('type', 'unknown'),
-                            'target': a.element_info.get('selector', ''),
-                            'text': a.element_info.get('text', '')
-                        },
-                        'retry_count': 0  # Rich detector doesn't use retries
-                    } for a in self.executed_actions
+                    self._action_record(action, current_url, compiled_at) for action in self.executed_actions
                 ],
                 'state_analysis': state_summary,
                 'error_analysis': error_summary,
@@ -547,6 +530,46 @@ class CleanWebExplorer:
         
         return results
     
+    @staticmethod
+    def _action_record(action, url: str, timestamp: float) -> Dict[str, Any]:
+        """Convert an ActionResult into the dict stored in the detailed results."""
+        state_changes = action.state_changes or []
+        element_type = action.element_info.get('type', 'unknown')
+        selector = action.element_info.get('selector', 'unknown')
+        text = action.element_info.get('text', '')
+        
+        return {
+            'success': action.success,
+            'action_type': action.action_type,
+            'element_type': element_type,
+            'selector': selector,
+            'text': text,
+            'duration': action.duration,
+            'error': action.error_message,
+            'url': url,
+            'timestamp': timestamp,
+            
+            # Rich state detection data
+            'state_changes': [change.__dict__ if hasattr(change, '__dict__') else change for change in state_changes],
+            'success_assessment': action.success_assessment,
+            'baseline_state': action.baseline_state,
+            'final_state': action.final_state,
+            
+            # Enhanced context for XML analysis
+            'url_changed': any(getattr(change, 'change_type', None) == 'navigation' for change in state_changes),
+            'state_changed': len(state_changes) > 0,
+            'navigation_occurred': any(getattr(change, 'category', None) == 'url_change' for change in state_changes),
+            
+            # Legacy format compatibility
+            'action': {
+                'action': action.action_type,
+                'element_type': element_type,
+                'target': action.element_info.get('selector', ''),
+                'text': text
+            },
+            'retry_count': 0  # Rich detector doesn't use retries
+        }
+    
     async def _save_session(self, results: Dict[str, Any]) -> None:
         """Save session results and generate reports."""
         logger.info(f"📊 POST-EXPLORATION: Starting session save with {results['exploration_summary']['total_actions_performed']} actions from {results['exploration_summary']['pages_visited']} pages")
@@ -554,21 +577,14 @@ class CleanWebExplorer:
             # Generate XML sitemap for ChatGPT
             xml_sitemap = self.reporter.generate_xml_sitemap(results['detailed_results'])
             
-            # Generate JSON report
-            json_report = self.reporter.generate_json_report(results['detailed_results'])
-            
-            # Save using session manager
+            # Save using session manager (the full JSON report is written by
+            # save_session_report, so it is not serialized a second time here)
             domain = self.navigation_utils.get_domain(self.base_url).replace('.', '_')
-            self.session_manager.save_sitemap(xml_sitemap, domain)
+            await asyncio.to_thread(self.session_manager.save_sitemap, xml_sitemap, domain)
             await self.session_manager.save_session_report(results)
             
-            # Generate ChatGPT analysis prompt
-            analysis_prompt = self.reporter.generate_chatgpt_analysis_prompt(
-                xml_sitemap, results['detailed_results']
-            )
-            
             logger.info(f"💾 Session saved: {self.session_manager.session_dir}")
-            logger.info("📄 Reports generated: XML sitemap, JSON report, ChatGPT prompt")
+            logger.info("📄 Reports generated: XML sitemap, session report")
             
         except Exception as e:
             logger.error(f"Error saving session: {e}")
@@ -613,7 +629,7 @@ class CleanWebExplorer:
                 break
                 
             if max_elements and total_actions >= max_elements:
-                logger.info(f"   🛑 Reached element limit: {max_elements}")
+                logger.info("   🛑 Reached element limit: %s", max_elements)
                 break
             
             # Test the first untested element
@@ -621,7 +637,7 @@ class CleanWebExplorer:
             element_selector = element.get('selector')
             element_text = element.get('text', 'no text')[:30]
             
-            logger.info(f"   🎯 Testing element {total_actions + 1}: {element_text}")
+            logger.info("   🎯 Testing element %s: %s", total_actions + 1, element_text)
             
             # Multiple retry strategies for robustness
             success = False
@@ -637,7 +653,7 @@ class CleanWebExplorer:
                             self.executed_actions.extend(modal_results)
                             total_actions += len(modal_results)
                             successful_actions += len([r for r in modal_results if r.success])
-                            logger.info(f"   📊 Modal exploration completed: {len(modal_results)} interactions")
+                            logger.info("   📊 Modal exploration completed: %s interactions", len(modal_results))
                         
                         # Now dismiss the modal to continue regular exploration
                         await self.modal_handler.dismiss_modal()
@@ -649,7 +665,7 @@ class CleanWebExplorer:
                     
                     # Enhanced element validation
                     if not await self._enhanced_element_validation(element):
-                        logger.warning(f"   ⚠️ Element failed validation (attempt {retry_attempt + 1}): {element_text}")
+                        logger.warning("   ⚠️ Element failed validation (attempt %s): %s", retry_attempt + 1, element_text)
                         if retry_attempt < max_retries - 1:
                             await asyncio.sleep(1)  # Wait and retry
                             continue
@@ -679,14 +695,14 @@ class CleanWebExplorer:
                         # Check if action opened a modal - if so, explore it
                         post_action_modals = await self.modal_handler.detect_modals()
                         if post_action_modals:
-                            logger.info(f"🎭 Modal appeared after action on '{element_text}', exploring content")
+                            logger.info("🎭 Modal appeared after action on '%s', exploring content", element_text)
                             modal_results = await self.modal_handler.explore_modal_content()
                             if modal_results:
                                 # Record modal interactions
                                 self.executed_actions.extend(modal_results)
                                 total_actions += len(modal_results)
                                 successful_actions += len([r for r in modal_results if r.success])
-                                logger.info(f"   📊 Post-action modal exploration: {len(modal_results)} interactions")
+                                logger.info("   📊 Post-action modal exploration: %s interactions", len(modal_results))
                             
                             # Dismiss modal to continue exploration
                             await self.modal_handler.dismiss_modal()
@@ -698,17 +714,17 @@ class CleanWebExplorer:
                     # Check for navigation - but continue exhaustive testing
                     new_url = self.browser_manager.get_current_url()
                     if new_url != current_url:
-                        logger.info(f"   🔄 Navigation detected: {current_url} → {new_url}")
+                        logger.info("   🔄 Navigation detected: %s → %s", current_url, new_url)
                         
                         # Store discovered URL for BFS queue (handled by caller)
                         if not hasattr(self, '_discovered_urls'):
                             self._discovered_urls = []
                         if new_url not in self._discovered_urls:
                             self._discovered_urls.append(new_url)
-                            logger.info(f"   🆕 URL discovered for later exploration: {new_url}")
+                            logger.info("   🆕 URL discovered for later exploration: %s", new_url)
                         
                         # Navigate back to continue exhaustive testing of current page
-                        logger.info(f"   🔄 Returning to continue exhaustive testing: {current_url}")
+                        logger.info("   🔄 Returning to continue exhaustive testing: %s", current_url)
                         await self.browser_manager.navigate(current_url)
                         await asyncio.sleep(2)  # Wait for page to load
                         
@@ -717,14 +733,14 @@ class CleanWebExplorer:
                     break  # Success, move to next element
                     
                 except Exception as e:
-                    logger.warning(f"   ⚠️ Action failed (attempt {retry_attempt + 1}): {e}")
+                    logger.warning("   ⚠️ Action failed (attempt %s): %s", retry_attempt + 1, e)
                     if retry_attempt < max_retries - 1:
                         await asyncio.sleep(1)  # Wait before retry
                         # Re-navigate to ensure clean state
                         await self.browser_manager.navigate(current_url)
                         await asyncio.sleep(2)
                     else:
-                        logger.error(f"   ❌ Element failed after {max_retries} attempts: {element_text}")
+                        logger.error("   ❌ Element failed after %s attempts: %s", max_retries, element_text)
                         total_actions += 1  # Count as attempted
             
             # Mark element as tested (success or failure)
@@ -819,17 +835,17 @@ class CleanWebExplorer:
             scored_elements.sort(key=lambda x: x[1], reverse=True)
             
             # Log prioritization info
-            if scored_elements:
+            if scored_elements and logger.isEnabledFor(logging.DEBUG):
                 top_element = scored_elements[0]
                 bottom_element = scored_elements[-1]
-                logger.debug(f"   🎯 Element prioritization: {len(elements)} elements")
-                logger.debug(f"      Most reliable: {top_element[0].get('text', 'no text')[:20]} (score: {top_element[1]})")
-                logger.debug(f"      Least reliable: {bottom_element[0].get('text', 'no text')[:20]} (score: {bottom_element[1]})")
+                logger.debug("   🎯 Element prioritization: %s elements", len(elements))
+                logger.debug("      Most reliable: %s (score: %s)", top_element[0].get('text', 'no text')[:20], top_element[1])
+                logger.debug("      Least reliable: %s (score: %s)", bottom_element[0].get('text', 'no text')[:20], bottom_element[1])
             
             return [element for element, score in scored_elements]
             
         except Exception as e:
-            logger.debug(f"Element prioritization failed: {e}")
+            logger.debug("Element prioritization failed: %s", e)
             return elements  # Return original order if prioritization fails
 
     async def _validate_element_availability(self, element: Dict[str, Any]) -> bool:
@@ -853,7 +869,7 @@ class CleanWebExplorer:
                 return await self._try_alternative_selectors(element)
                 
         except Exception as e:
-            logger.debug(f"Element validation failed: {e}")
+            logger.debug("Element validation failed: %s", e)
             return False
     
     async def _try_alternative_selectors(self, element: Dict[str, Any]) -> bool:
@@ -891,7 +907,7 @@ class CleanWebExplorer:
                     await page.wait_for_selector(alt_selector, timeout=500, state='visible')
                     # Update element selector for future use
                     element['selector'] = alt_selector
-                    logger.debug(f"   🔄 Found element using alternative selector: {alt_selector}")
+                    logger.debug("   🔄 Found element using alternative selector: %s", alt_selector)
                     return True
                 except:
                     continue
@@ -899,7 +915,7 @@ class CleanWebExplorer:
             return False
             
         except Exception as e:
-            logger.debug(f"Alternative selector search failed: {e}")
+            logger.debug("Alternative selector search failed: %s", e)
             return False
 
     async def _wait_for_dom_stability(self, stability_time: float = 2.0, max_wait: float = 10.0) -> bool:
@@ -921,20 +937,20 @@ class CleanWebExplorer:
                 if current_count == last_element_count:
                     stable_count += 1
                     if stable_count >= (stability_time * 2):  # Check every 0.5s
-                        logger.debug(f"   ✅ DOM stabilized with {current_count} elements")
+                        logger.debug("   ✅ DOM stabilized with %s elements", current_count)
                         return True
                 else:
                     stable_count = 0
                     last_element_count = current_count
-                    logger.debug(f"   🔄 DOM changing: {current_count} elements")
+                    logger.debug("   🔄 DOM changing: %s elements", current_count)
                 
                 await asyncio.sleep(0.5)
             
-            logger.warning(f"   ⏰ DOM stability timeout after {max_wait}s")
+            logger.warning("   ⏰ DOM stability timeout after %ss", max_wait)
             return False
             
         except Exception as e:
-            logger.debug(f"DOM stability check failed: {e}")
+            logger.debug("DOM stability check failed: %s", e)
             return False
 
     async def _enhanced_element_validation(self, element: Dict[str, Any]) -> bool:
@@ -959,17 +975,17 @@ class CleanWebExplorer:
             for check_name, check_func in checks:
                 try:
                     if not await check_func(selector):
-                        logger.debug(f"   ❌ Element failed {check_name} check: {selector}")
+                        logger.debug("   ❌ Element failed %s check: %s", check_name, selector)
                         return False
                 except Exception as e:
-                    logger.debug(f"   ⚠️ {check_name} check error: {e}")
+                    logger.debug("   ⚠️ %s check error: %s", check_name, e)
                     return False
             
-            logger.debug(f"   ✅ Element passed all validation checks: {selector}")
+            logger.debug("   ✅ Element passed all validation checks: %s", selector)
             return True
             
         except Exception as e:
-            logger.debug(f"Enhanced validation failed: {e}")
+            logger.debug("Enhanced validation failed: %s", e)
             return False
     
     async def _check_element_exists(self, selector: str) -> bool:
@@ -1075,11 +1091,11 @@ class CleanWebExplorer:
             except:
                 pass  # Use base timeout if extraction fails
             
-            logger.debug(f"   ⏱️ Adaptive timeout: {timeout}ms for {element.get('text', 'element')}")
+            logger.debug("   ⏱️ Adaptive timeout: %sms for %s", timeout, element.get('text', 'element'))
             return int(timeout)
             
         except Exception as e:
-            logger.debug(f"Adaptive timeout calculation failed: {e}")
+            logger.debug("Adaptive timeout calculation failed: %s", e)
             return base_timeout
 
 
@@ -1112,4 +1128,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main()) 
\ No newline at end of file
@@ -6,6 +6,7 @@ Converts exploration session data into runnable test files for various framework
 Generates Playwright, Jest, Cypress, and Selenium test files from exploration results.
 """
 
+import asyncio
 import json
 import time
 from datetime import datetime
@@ -1910,12 +1911,12 @@ async def generate_tests_from_session(session_dir: Path, output_dir: Path, opena
     """
     # Load session data
     session_report_path = session_dir / "reports" / "session_report.json"
-    if not session_report_path.exists():
+    try:
+        # Reports can be large; read them off the event loop
+        session_data = json.loads(await asyncio.to_thread(session_report_path.read_bytes))
+    except FileNotFoundError:
         raise FileNotFoundError(f"Session report not found: {session_report_path}")
     
-    with open(session_report_path, 'r', encoding='utf-8') as f:
-        session_data = json.load(f)
-    
     # Extract base URL
     base_url = session_data.get('session_info', {}).get('base_url', 'https://example.com')
     
@@ -1942,7 +1943,6 @@ async def generate_tests_from_session(session_dir: Path, output_dir: Path, opena
 
 
 if __name__ == "__main__":
-    import asyncio
     import sys
     
     if len(sys.argv) != 3:
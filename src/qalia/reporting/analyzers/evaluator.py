@@ -324,18 +324,15 @@ class QAEvaluator:
             content_changes = self._detect_content_changes(before_state, after_state)
             
             # Collect all observable changes
-            observable_changes = []
-            
-            if url_changed:
-                observable_changes.append("URL navigation")
-            if title_changed:
-                observable_changes.append("page title change")
-            if modal_appeared:
-                observable_changes.append("modal/dialog appearance")
-            if form_changes:
-                observable_changes.append("form state changes")
-            if content_changes:
-                observable_changes.append("page content changes")
+            observable_changes = [
+                label for changed, label in (
+                    (url_changed, "URL navigation"),
+                    (title_changed, "page title change"),
+                    (modal_appeared, "modal/dialog appearance"),
+                    (form_changes, "form state changes"),
+                    (content_changes, "page content changes"),
+                ) if changed
+            ]
             
             if observable_changes:
                 evaluation['successes'].append(f"Click action caused observable changes: {', '.join(observable_changes)}")
@@ -7,8 +7,8 @@ Extracted from multiple explorer implementations to provide consistent browser h
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, List, Tuple
+from dataclasses import dataclass, field
 
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
@@ -41,6 +41,97 @@ class BrowserConfig:
             ]
 
 
+@dataclass
+class _SharedBrowser:
+    """Browser process shared by the BrowserManagers using the same launch options."""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    playwright: Any = None
+    browser: Optional[Browser] = None
+    users: int = 0
+
+
+# Shared browsers keyed by (event loop, headless, launch args). Playwright
+# objects are bound to the loop that created them, and a browser is closed
+# as soon as its last manager cleans up, so no process outlives its loop.
+_shared_browsers: Dict[Tuple, _SharedBrowser] = {}
+
+
+async def _acquire_shared_browser(config: BrowserConfig) -> Tuple[Tuple, _SharedBrowser]:
+    """Register a user of the shared browser for config, launching it if needed."""
+    key = (asyncio.get_running_loop(), config.headless, tuple(config.args))
+    shared = _shared_browsers.setdefault(key, _SharedBrowser())
+    shared.users += 1
+    
+    try:
+        async with shared.lock:
+            if shared.browser is None or not shared.browser.is_connected():
+                await _close_shared_browser(shared)
+                shared.playwright = await async_playwright().start()
+                shared.browser = await _launch_browser(shared.playwright, config)
+    except BaseException:
+        await _release_shared_browser(key)
+        raise
+    
+    return key, shared
+
+
+async def _release_shared_browser(key: Tuple) -> None:
+    """Drop a user of a shared browser, closing it once nobody uses it."""
+    shared = _shared_browsers.get(key)
+    if shared is None:
+        return
+    
+    shared.users -= 1
+    if shared.users <= 0:
+        del _shared_browsers[key]
+        await _close_shared_browser(shared)
+
+
+async def _close_shared_browser(shared: _SharedBrowser) -> None:
+    """Close a shared browser process and its Playwright driver."""
+    if shared.browser:
+        await shared.browser.close()
+        shared.browser = None
+    
+    if shared.playwright:
+        await shared.playwright.stop()
+        shared.playwright = None
+
+
+async def _launch_browser(playwright, config: BrowserConfig) -> Browser:
+    """Launch a browser, falling back to Firefox and WebKit if Chromium fails."""
+    # Launch browser - try different browsers if chromium fails
+    try:
+        logger.info("Attempting to launch Chromium...")
+        browser = await playwright.chromium.launch(
+            headless=config.headless,
+            args=config.args
+        )
+        logger.info("✅ Chromium launched successfully")
+    except Exception as chromium_error:
+        logger.warning(f"Chromium launch failed: {chromium_error}")
+        try:
+            logger.info("Attempting to launch Firefox...")
+            browser = await playwright.firefox.launch(
+                headless=config.headless,
+                args=['--no-sandbox'] if config.headless else []
+            )
+            logger.info("✅ Firefox launched successfully")
+        except Exception as firefox_error:
+            logger.warning(f"Firefox launch failed: {firefox_error}")
+            try:
+                logger.info("Attempting to launch WebKit...")
+                browser = await playwright.webkit.launch(
+                    headless=config.headless
+                )
+                logger.info("✅ WebKit launched successfully")
+            except Exception as webkit_error:
+                logger.error(f"All browsers failed to launch. WebKit error: {webkit_error}")
+                raise Exception("No browsers available for launch")
+    
+    return browser
+
+
 class BrowserManager:
     """
     Manages browser lifecycle and event handling for website exploration.
@@ -65,6 +156,7 @@ class BrowserManager:
         
         # State tracking
         self.is_setup = False
+        self._shared_key: Optional[Tuple] = None
     
     async def setup(self) -> None:
         """Initialize browser with configuration."""
@@ -75,37 +167,11 @@ class BrowserManager:
         try:
             logger.info("🚀 Setting up browser...")
             
-            # Start Playwright
-            self.playwright = await async_playwright().start()
-            
-            # Launch browser - try different browsers if chromium fails
-            try:
-                logger.info("Attempting to launch Chromium...")
-                self.browser = await self.playwright.chromium.launch(
-                    headless=self.config.headless,
-                    args=self.config.args
-                )
-                logger.info("✅ Chromium launched successfully")
-            except Exception as chromium_error:
-                logger.warning(f"Chromium launch failed: {chromium_error}")
-                try:
-                    logger.info("Attempting to launch Firefox...")
-                    self.browser = await self.playwright.firefox.launch(
-                        headless=self.config.headless,
-                        args=['--no-sandbox'] if self.config.headless else []
-                    )
-                    logger.info("✅ Firefox launched successfully")
-                except Exception as firefox_error:
-                    logger.warning(f"Firefox launch failed: {firefox_error}")
-                    try:
-                        logger.info("Attempting to launch WebKit...")
-                        self.browser = await self.playwright.webkit.launch(
-                            headless=self.config.headless
-                        )
-                        logger.info("✅ WebKit launched successfully")
-                    except Exception as webkit_error:
-                        logger.error(f"All browsers failed to launch. WebKit error: {webkit_error}")
-                        raise Exception("No browsers available for launch")
+            # Reuse the browser process of other managers on this event loop;
+            # only the context and page below belong to this manager
+            self._shared_key, shared = await _acquire_shared_browser(self.config)
+            self.playwright = shared.playwright
+            self.browser = shared.browser
             
             # Create context
             self.context = await self.browser.new_context(
@@ -177,19 +243,21 @@ class BrowserManager:
                 await self.context.close()
                 self.context = None
             
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-            
             self.is_setup = False
             logger.info("✅ Browser cleanup completed")
             
         except Exception as e:
             logger.warning(f"Error during browser cleanup: {e}")
+        
+        # Always give back the shared browser, even if closing the page failed
+        self.browser = None
+        self.playwright = None
+        if self._shared_key is not None:
+            key, self._shared_key = self._shared_key, None
+            try:
+                await _release_shared_browser(key)
+            except Exception as e:
+                logger.warning(f"Error closing shared browser: {e}")
     
     def add_console_handler(self, handler: Callable) -> None:
         """Add a console message handler."""
@@ -5,6 +5,7 @@ Handles discovery and extraction of interactive elements from web pages.
 Supports both static HTML parsing and live page element discovery.
 """
 
+import asyncio
 import logging
 import hashlib
 from typing import List, Dict, Any, Optional
@@ -13,6 +14,57 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Collects every visible interactive element and the attributes the extractor
+# needs in one browser round trip. Visibility follows Playwright's rule: a
+# non-empty bounding box and no visibility:hidden. Indexes count all matches
+# of a selector, visible or not, as locator.all() did.
+LIVE_ELEMENTS_SCRIPT = """
+(buttonSelectors) => {
+    const ATTRIBUTES = [
+        'id', 'data-testid', 'data-test', 'data-cy', 'name', 'value',
+        'aria-label', 'href', 'type', 'placeholder'
+    ];
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const describe = (el, index) => {
+        const attributes = {};
+        for (const name of ATTRIBUTES) {
+            attributes[name] = el.getAttribute(name);
+        }
+        return {index, tag: el.tagName.toLowerCase(), text: el.innerText || '', attributes};
+    };
+    const collect = (selector, extra) => {
+        const found = [];
+        document.querySelectorAll(selector).forEach((el, index) => {
+            if (isVisible(el)) {
+                const info = describe(el, index);
+                if (extra) {
+                    Object.assign(info, extra(el));
+                }
+                found.push(info);
+            }
+        });
+        return found;
+    };
+    return {
+        buttons: buttonSelectors.map((selector) => collect(selector)),
+        links: collect('a[href]'),
+        inputs: collect('input, textarea'),
+        selects: collect('select', (el) => ({
+            options: Array.from(el.querySelectorAll('option'), (opt) => {
+                const value = opt.getAttribute('value') || '';
+                return {value, text: (opt.innerText || value).trim()};
+            })
+        }))
+    };
+}
+"""
+
+# Live input types the explorer knows how to fill
+TEXT_INPUT_TYPES = frozenset({'text', 'email', 'password', 'search', 'tel', 'url', 'number'})
+
 
 class ElementExtractor:
     """
@@ -70,15 +122,19 @@ class ElementExtractor:
         url = page.url
         
         try:
-            # Get page content for fingerprinting
-            content = await page.content()
+            # Fetch the content for fingerprinting alongside a single batched
+            # query for all elements, instead of several calls per element
+            content, found = await asyncio.gather(
+                page.content(),
+                page.evaluate(LIVE_ELEMENTS_SCRIPT, self.button_selectors)
+            )
             state_hash = self._generate_state_hash(content)
             
             # Extract different element types
-            buttons = await self._extract_buttons_live(page, url, state_hash)
-            links = await self._extract_links_live(page, url, state_hash)
-            inputs = await self._extract_inputs_live(page, url, state_hash)
-            selects = await self._extract_selects_live(page, url, state_hash)
+            buttons = self._extract_buttons_live(found['buttons'], url, state_hash)
+            links = self._extract_links_live(found['links'], url, state_hash)
+            inputs = self._extract_inputs_live(found['inputs'], url, state_hash)
+            selects = self._extract_selects_live(found['selects'], url, state_hash)
             
             elements.extend(buttons)
             elements.extend(links)
@@ -88,7 +144,7 @@ class ElementExtractor:
             # Remove duplicates and filter
             elements = self._deduplicate_elements(elements)
             
-            logger.info(f"📋 Extracted {len(elements)} interactive elements from live page")
+            logger.info("📋 Extracted %s interactive elements from live page", len(elements))
             self._log_element_summary(elements)
             
             return elements
@@ -137,131 +193,91 @@ class ElementExtractor:
             logger.error(f"HTML element extraction failed: {e}")
             return []
     
-    async def _extract_buttons_live(self, page, url: str, state_hash: str) -> List[Dict[str, Any]]:
-        """Extract button elements from live page."""
+    def _extract_buttons_live(self, matches: List[List[Dict[str, Any]]], url: str, state_hash: str) -> List[Dict[str, Any]]:
+        """Build button elements from the live page query, one match list per button selector."""
         buttons = []
         
-        for selector in self.button_selectors:
-            try:
-                elements = await page.locator(selector).all()
-                for i, button in enumerate(elements):
-                    if await button.is_visible():
-                        text = (await button.inner_text() or 
-                               await button.get_attribute('value') or 
-                               await button.get_attribute('aria-label') or 
-                               f"button_{i}")
-                        
-                        # Generate robust selector
-                        robust_selector = await self._generate_robust_selector(button, text, 'button')
-                        
-                        buttons.append({
-                            'type': 'button',
-                            'text': text.strip()[:100],
-                            'selector': robust_selector,
-                            'index': i,
-                            'url': url,
-                            'state_hash': state_hash,
-                            'base_selector': selector
-                        })
-            except Exception as e:
-                logger.debug(f"Error extracting buttons with selector {selector}: {e}")
+        for selector, found in zip(self.button_selectors, matches):
+            for button in found:
+                attributes = button['attributes']
+                text = (button['text'] or
+                        attributes['value'] or
+                        attributes['aria-label'] or
+                        f"button_{button['index']}")
+                
+                buttons.append({
+                    'type': 'button',
+                    'text': text.strip()[:100],
+                    'selector': self._generate_robust_selector(button, text, 'button'),
+                    'index': button['index'],
+                    'url': url,
+                    'state_hash': state_hash,
+                    'base_selector': selector
+                })
         
         return buttons
     
-    async def _extract_links_live(self, page, url: str, state_hash: str) -> List[Dict[str, Any]]:
-        """Extract link elements from live page."""
+    def _extract_links_live(self, found: List[Dict[str, Any]], url: str, state_hash: str) -> List[Dict[str, Any]]:
+        """Build link elements from the live page query."""
         links = []
         
-        try:
-            elements = await page.locator('a[href]').all()
-            for i, link in enumerate(elements):
-                if await link.is_visible():
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text() or href
-                    
-                    if href and not href.startswith('#') and not href.startswith('javascript:'):
-                        full_href = urljoin(url, href)
-                        
-                        # Generate robust selector
-                        robust_selector = await self._generate_robust_selector(link, text, 'link')
-                        
-                        links.append({
-                            'type': 'link',
-                            'text': text.strip()[:100],
-                            'href': full_href,
-                            'selector': robust_selector,
-                            'index': i,
-                            'url': url,
-                            'state_hash': state_hash
-                        })
-        except Exception as e:
-            logger.debug(f"Error extracting links: {e}")
+        for link in found:
+            href = link['attributes']['href']
+            if not href or href.startswith('#') or href.startswith('javascript:'):
+                continue
+            
+            text = link['text'] or href
+            links.append({
+                'type': 'link',
+                'text': text.strip()[:100],
+                'href': urljoin(url, href),
+                'selector': self._generate_robust_selector(link, text, 'link'),
+                'index': link['index'],
+                'url': url,
+                'state_hash': state_hash
+            })
         
         return links
     
-    async def _extract_inputs_live(self, page, url: str, state_hash: str) -> List[Dict[str, Any]]:
-        """Extract input elements from live page."""
+    def _extract_inputs_live(self, found: List[Dict[str, Any]], url: str, state_hash: str) -> List[Dict[str, Any]]:
+        """Build input elements from the live page query."""
         inputs = []
         
-        try:
-            elements = await page.locator('input, textarea').all()
-            for i, input_elem in enumerate(elements):
-                if await input_elem.is_visible():
-                    input_type = await input_elem.get_attribute('type') or 'text'
-                    name = await input_elem.get_attribute('name') or f"input_{i}"
-                    placeholder = await input_elem.get_attribute('placeholder') or ''
-                    
-                    if input_type in ['text', 'email', 'password', 'search', 'tel', 'url', 'number'] or input_elem.tag_name == 'textarea':
-                        # Generate robust selector
-                        robust_selector = await self._generate_robust_selector(input_elem, name, 'input')
-                        
-                        inputs.append({
-                            'type': 'input',
-                            'input_type': input_type,
-                            'name': name,
-                            'placeholder': placeholder,
-                            'selector': robust_selector,
-                            'index': i,
-                            'url': url,
-                            'state_hash': state_hash
-                        })
-        except Exception as e:
-            logger.debug(f"Error extracting inputs: {e}")
+        for input_elem in found:
+            attributes = input_elem['attributes']
+            input_type = attributes['type'] or 'text'
+            if input_type not in TEXT_INPUT_TYPES and input_elem['tag'] != 'textarea':
+                continue
+            
+            name = attributes['name'] or f"input_{input_elem['index']}"
+            inputs.append({
+                'type': 'input',
+                'input_type': input_type,
+                'name': name,
+                'placeholder': attributes['placeholder'] or '',
+                'selector': self._generate_robust_selector(input_elem, name, 'input'),
+                'index': input_elem['index'],
+                'url': url,
+                'state_hash': state_hash
+            })
         
         return inputs
     
-    async def _extract_selects_live(self, page, url: str, state_hash: str) -> List[Dict[str, Any]]:
-        """Extract select elements from live page."""
+    def _extract_selects_live(self, found: List[Dict[str, Any]], url: str, state_hash: str) -> List[Dict[str, Any]]:
+        """Build select elements from the live page query."""
         selects = []
         
-        try:
-            elements = await page.locator('select').all()
-            for i, select in enumerate(elements):
-                if await select.is_visible():
-                    name = await select.get_attribute('name') or f"select_{i}"
-                    
-                    # Extract options
-                    options = []
-                    option_elements = await select.locator('option').all()
-                    for opt in option_elements:
-                        value = await opt.get_attribute('value') or ''
-                        text = await opt.inner_text() or value
-                        options.append({'value': value, 'text': text.strip()})
-                    
-                    # Generate robust selector
-                    robust_selector = await self._generate_robust_selector(select, name, 'select')
-                    
-                    selects.append({
-                        'type': 'select',
-                        'name': name,
-                        'selector': robust_selector,
-                        'options': options,
-                        'index': i,
-                        'url': url,
-                        'state_hash': state_hash
-                    })
-        except Exception as e:
-            logger.debug(f"Error extracting selects: {e}")
+        for select in found:
+            name = select['attributes']['name'] or f"select_{select['index']}"
+            selects.append({
+                'type': 'select',
+                'name': name,
+                'selector': self._generate_robust_selector(select, name, 'select'),
+                'options': select['options'],
+                'index': select['index'],
+                'url': url,
+                'state_hash': state_hash
+            })
         
         return selects
     
@@ -376,44 +392,33 @@ class ElementExtractor:
         
         return selects
     
-    async def _generate_robust_selector(self, element, text: str, element_type: str) -> str:
-        """Generate robust selector for live element."""
-        try:
-            # Try ID first
-            elem_id = await element.get_attribute('id')
-            if elem_id:
-                return f"#{elem_id}"
-            
-            # Try test attributes
-            test_attrs = ['data-testid', 'data-test', 'data-cy']
-            for attr in test_attrs:
-                value = await element.get_attribute(attr)
-                if value:
-                    return f"[{attr}='{value}']"
-            
-            # Try name attribute
-            name = await element.get_attribute('name')
-            if name:
-                tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-                return f"{tag_name}[name='{name}']"
-            
-            # Try text-based selectors
-            if text and len(text.strip()) < 50:
-                clean_text = text.strip().replace('"', '\\"')
-                tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-                
-                if element_type == 'button':
-                    return f'button:has-text("{clean_text}")'
-                elif element_type == 'link':
-                    return f'a:has-text("{clean_text}")'
-            
-            # Fallback to tag + nth-child
-            tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-            return f"{tag_name}"
-            
-        except Exception as e:
-            logger.debug(f"Error generating selector: {e}")
-            return f"{element_type}"
+    def _generate_robust_selector(self, element: Dict[str, Any], text: str, element_type: str) -> str:
+        """Generate robust selector for an element returned by the live page query."""
+        attributes = element['attributes']
+        
+        # Try ID first
+        if attributes['id']:
+            return f"#{attributes['id']}"
+        
+        # Try test attributes
+        for attr in ['data-testid', 'data-test', 'data-cy']:
+            if attributes[attr]:
+                return f"[{attr}='{attributes[attr]}']"
+        
+        # Try name attribute
+        if attributes['name']:
+            return f"{element['tag']}[name='{attributes['name']}']"
+        
+        # Try text-based selectors
+        if text and len(text.strip()) < 50:
+            clean_text = text.strip().replace('"', '\\"')
+            if element_type == 'button':
+                return f'button:has-text("{clean_text}")'
+            elif element_type == 'link':
+                return f'a:has-text("{clean_text}")'
+        
+        # Fallback to the tag name
+        return element['tag']
     
     def _generate_static_selector(self, element, text: str, element_type: str) -> str:
         """Generate selector for static HTML element."""
@@ -462,13 +467,17 @@ class ElementExtractor:
     
     def _log_element_summary(self, elements: List[Dict[str, Any]]) -> None:
         """Log summary of extracted elements."""
+        # Extraction runs before every action, so skip the tally when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         summary = {}
         for element in elements:
             elem_type = element['type']
             summary[elem_type] = summary.get(elem_type, 0) + 1
         
         summary_parts = [f"{count} {elem_type}s" for elem_type, count in summary.items()]
-        logger.info(f"   📊 Found: {', '.join(summary_parts)}")
+        logger.info("   📊 Found: %s", ', '.join(summary_parts))
     
     def filter_elements_by_criteria(self, elements: List[Dict[str, Any]], **criteria) -> List[Dict[str, Any]]:
         """Filter elements by various criteria."""
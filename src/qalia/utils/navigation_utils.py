@@ -11,6 +11,9 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Fragments that address client-side routes rather than in-page anchors
+HASH_ROUTE_PREFIXES = ('/', '!/')
+
 
 class NavigationUtils:
     """
@@ -56,17 +59,29 @@ class NavigationUtils:
         return True
     
     def clean_url(self, url: str) -> str:
-        """Clean URL by removing fragments and unnecessary parameters."""
+        """
+        Normalize a URL into a key so equivalent links compare equal.
+        
+        Query parameters are ordered by name, a trailing slash on the path is
+        dropped and plain anchors are removed. Route-like fragments ('#/swap',
+        '#!/pool') are kept because hash-routed apps use them to address
+        separate pages. The result is only meant for deduplication; navigate
+        to the original URL, which the site may not serve in this form.
+        """
         try:
             parsed = urlparse(url)
-            # Remove fragment (anchor)
+            # Stable sort by name keeps repeated keys (a=2&a=1) in their original
+            # order and leaves the raw encoding untouched
+            query = '&'.join(sorted(parsed.query.split('&'), key=lambda p: p.split('=', 1)[0])) if parsed.query else ''
+            path = parsed.path.rstrip('/') or '/'
+            fragment = parsed.fragment if parsed.fragment.startswith(HASH_ROUTE_PREFIXES) else ''
             cleaned = urlunparse((
                 parsed.scheme,
                 parsed.netloc,
-                parsed.path,
+                path,
                 parsed.params,
-                parsed.query,
-                ''  # Remove fragment
+                query,
+                fragment
             ))
             return cleaned
         except:
@@ -14,6 +14,19 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Cheap fingerprint of the URL and serialized DOM, hashed inside the browser so
+# only a short string crosses the Playwright connection
+PAGE_PROBE_SCRIPT = """
+() => {
+    const html = document.documentElement.outerHTML;
+    let hash = 0;
+    for (let i = 0; i < html.length; i++) {
+        hash = (Math.imul(hash, 31) + html.charCodeAt(i)) | 0;
+    }
+    return `${location.href}|${html.length}|${hash}`;
+}
+"""
+
 
 @dataclass
 class PageState:
@@ -55,6 +68,7 @@ class StateManager:
         self.discovered_states: Dict[str, PageState] = {}
         self.state_transitions: List[StateTransition] = []
         self.current_state: Optional[str] = None
+        self._last_probe: Optional[str] = None  # PAGE_PROBE_SCRIPT result for current_state
         
         # State fingerprinting
         self.state_fingerprints: Set[str] = set()
@@ -82,6 +96,19 @@ class StateManager:
         try:
             url = page.url
             
+            # Skip fetching and hashing the full page when neither the URL nor
+            # the DOM changed since the last capture (e.g. after a no-op click)
+            probe = None
+            if page_content is None and interactive_elements is None:
+                try:
+                    probe = await page.evaluate(PAGE_PROBE_SCRIPT)
+                except Exception as e:
+                    logger.debug(f"Error probing page state: {e}")
+                
+                if probe is not None and probe == self._last_probe and self.current_state:
+                    self.state_visit_counts[self.current_state] += 1
+                    return self.current_state
+            
             # Get page content
             if page_content is None:
                 page_content = await page.content()
@@ -128,6 +155,7 @@ class StateManager:
                 await self._record_state_transition(self.current_state, state_hash, url)
             
             self.current_state = state_hash
+            self._last_probe = probe
             return state_hash
             
         except Exception as e:
@@ -451,5 +479,6 @@ class StateManager:
         self.state_visit_counts.clear()
         self.state_first_seen.clear()
         self.current_state = None
+        self._last_probe = None
         
         logger.info("🧹 All state data cleared") 
\ No newline at end of file
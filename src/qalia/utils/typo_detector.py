@@ -650,8 +650,6 @@ Please respond in this JSON format:
             
             # Parse JSON response
             try:
-                import json
-                
                 # Try to extract JSON from response if it's wrapped in markdown or other text
                 json_text = response_text
                 if '```json' in response_text:
@@ -8,34 +8,92 @@ performs automated QA analysis, and provides feedback through GitHub.
 """
 
 import asyncio
-import json
+import hmac
 import logging
 import os
+import re
+import sys
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
-from src.web.github_operations import GitHubManager, get_private_key
+from src.web.cache import TTLCache
+from src.web.github_config import get_app_config
+from src.web.github_operations import GitHubManager, decode_webhook_signature, get_private_key
 from src.cli.main import analyze_web_app
 from src.web.ui_server import setup_ui_server
 
-# Configure logging
+# Configure logging; LOG_FILE opts in to a (blocking) file handler
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE")
+
+# Fall back to INFO on an unknown level instead of failing at import time
+INVALID_LOG_LEVEL = None
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    INVALID_LOG_LEVEL, LOG_LEVEL = LOG_LEVEL, "INFO"
+
+log_handlers = [logging.StreamHandler()]
+if LOG_FILE:
+    log_handlers.append(logging.FileHandler(LOG_FILE))
+
+# force=True replaces any handlers an imported module may have installed
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/qalia.log'),
-        logging.StreamHandler()
-    ]
+    handlers=log_handlers,
+    force=True
 )
 logger = logging.getLogger(__name__)
+if INVALID_LOG_LEVEL:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", INVALID_LOG_LEVEL)
 
 # Global GitHub manager instance
 github_manager: GitHubManager = None
 
+# Recently accepted X-GitHub-Delivery IDs; GitHub reuses the ID on retries
+# and manual redeliveries, so a hit means the event is already being handled
+seen_deliveries = TTLCache(maxsize=4096, ttl=600)
+
+# Recently analyzed (repository, PR number, head SHA) keys; rebases and
+# force-pushes can fire several PR events for the same head commit within
+# seconds. Keys are dropped again when the analysis fails so it can be retried.
+analyzed_pr_commits = TTLCache(maxsize=1024, ttl=600)
+
+# Finished analysis results by (repository, commit SHA); the SHA pins both the
+# application code and its qalia.yml, so a later event for the same commit
+# (e.g. a new PR or the merge push) can republish without re-running analysis
+ANALYSIS_RESULTS_TTL = int(os.getenv("ANALYSIS_RESULTS_TTL", "86400"))
+analysis_results_cache = TTLCache(maxsize=256, ttl=ANALYSIS_RESULTS_TTL)
+
+# Bounded webhook backlog drained by a fixed pool of analysis workers; each
+# analysis drives a browser and git, so by default run one per two CPUs
+WEBHOOK_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", "64"))
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS") or max(1, (os.cpu_count() or 2) // 2))
+
+# Push events are only analyzed for these branches
+BRANCH_REF_PREFIX = "refs/heads/"
+ANALYZED_PUSH_BRANCHES = frozenset({"main", "master"})
+
+# Matches the push ref of an analyzed branch in a raw payload, so pushes to
+# other branches are dropped without parsing; escaped quotes inside string
+# values cannot match, and handle_push still checks the parsed ref
+ANALYZED_PUSH_REF_PATTERN = re.compile(
+    rb'"ref"\s*:\s*"' + re.escape(BRANCH_REF_PREFIX.encode())
+    + rb"(?:" + b"|".join(re.escape(b.encode()) for b in sorted(ANALYZED_PUSH_BRANCHES)) + rb')"'
+)
+
+# GitHub caps webhook payloads at 25 MB
+MAX_WEBHOOK_BODY_BYTES = 26 * 1024 * 1024
+
+# Webhook acknowledgements are constant, so serialize them once
+WEBHOOK_DUPLICATE_BODY = orjson.dumps({"status": "duplicate"})
+WEBHOOK_IGNORED_BODY = orjson.dumps({"status": "ignored"})
+WEBHOOK_QUEUED_BODY = orjson.dumps({"status": "queued"})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -44,17 +102,15 @@ async def lifespan(app: FastAPI):
     
     # Initialize GitHub manager
     try:
-        app_id = os.getenv("GITHUB_APP_ID")
-        webhook_secret = os.getenv("GITHUB_WEBHOOK_SECRET")
-        private_key = get_private_key()
+        config = get_app_config()
         
-        if not app_id:
+        if not config["github_app_id"]:
             raise ValueError("GITHUB_APP_ID environment variable not set")
         
         github_manager = GitHubManager(
-            app_id=app_id,
-            private_key=private_key,
-            webhook_secret=webhook_secret
+            app_id=config["github_app_id"],
+            private_key=get_private_key(),
+            webhook_secret=config["github_webhook_secret"]
         )
         
         logger.info("✅ GitHub manager initialized successfully")
@@ -62,6 +118,14 @@ async def lifespan(app: FastAPI):
         # Initialize UI server
         ui_server = setup_ui_server(app)
         logger.info("✅ UI server initialized successfully")
+        
+        # Start webhook workers
+        app.state.webhook_queue = asyncio.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+        app.state.webhook_workers = [
+            asyncio.create_task(webhook_worker(app.state.webhook_queue))
+            for _ in range(WEBHOOK_WORKERS)
+        ]
+        logger.info(f"✅ Started {WEBHOOK_WORKERS} webhook workers (queue size {WEBHOOK_QUEUE_SIZE})")
             
     except Exception as e:
         logger.error(f"❌ Failed to initialize GitHub manager: {e}")
@@ -71,6 +135,10 @@ async def lifespan(app: FastAPI):
     
     # Cleanup if needed
     logger.info("🔄 Shutting down...")
+    for worker in app.state.webhook_workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.webhook_workers, return_exceptions=True)
+    await github_manager.aclose()
 
 
 # Create FastAPI app with lifespan
@@ -78,7 +146,8 @@ app = FastAPI(
     title="Qalia QA AI - GitHub Integration",
     description="AI-powered QA testing system with GitHub integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -91,9 +160,11 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Detailed health check."""
+    webhook_queue = getattr(app.state, "webhook_queue", None)
     return {
         "status": "healthy",
         "github_manager": github_manager is not None,
+        "webhook_queue_depth": webhook_queue.qsize() if webhook_queue else 0,
         "timestamp": asyncio.get_event_loop().time()
     }
 
@@ -102,53 +173,113 @@ async def health_check():
 async def github_webhook(request: Request):
     """Handle GitHub webhook events."""
     try:
-        # Get request body and headers
-        body = await request.body()
+        # Get request headers
         signature = request.headers.get("X-Hub-Signature-256", "")
         event_type = request.headers.get("X-GitHub-Event", "")
+        delivery_id = request.headers.get("X-GitHub-Delivery", "")
         
-        # Verify webhook signature
-        if not github_manager.verify_webhook_signature(body, signature):
-            logger.error("❌ Invalid webhook signature")
-            raise HTTPException(status_code=401, detail="Invalid signature")
+        # Drop redeliveries before verifying or dispatching them again
+        if delivery_id and delivery_id in seen_deliveries:
+            logger.info("🔁 Ignoring duplicate delivery %s", delivery_id)
+            return Response(WEBHOOK_DUPLICATE_BODY, media_type="application/json")
         
-        # Parse JSON payload
-        try:
-            payload = json.loads(body.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON payload: {e}")
-            raise HTTPException(status_code=400, detail="Invalid JSON")
+        # Read the body and verify its signature in one streaming pass
+        body = await read_verified_body(request, signature)
+        
+        if delivery_id:
+            seen_deliveries.set(delivery_id)
         
-        logger.info(f"📥 Received {event_type} webhook event")
+        logger.info("📥 Received %s webhook event", event_type)
         
-        # Route webhook events
-        if event_type == "pull_request":
-            asyncio.create_task(handle_pull_request(payload))
-        elif event_type == "push":
-            asyncio.create_task(handle_push(payload))
-        else:
-            logger.info(f"ℹ️ Ignoring {event_type} event")
+        # Queue the raw body for the worker pool; parsing happens off the accept path
+        handler = EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            logger.info("ℹ️ Ignoring %s event", event_type)
+            return Response(WEBHOOK_IGNORED_BODY, media_type="application/json")
         
-        return JSONResponse({"status": "received"})
+        if event_type == "push" and not ANALYZED_PUSH_REF_PATTERN.search(body):
+            logger.info("ℹ️ Ignoring push to an unanalyzed branch")
+            return Response(WEBHOOK_IGNORED_BODY, media_type="application/json")
+        
+        try:
+            request.app.state.webhook_queue.put_nowait((handler, delivery_id, body))
+        except asyncio.QueueFull:
+            # Forget the delivery so GitHub's retry is not treated as a duplicate
+            seen_deliveries.pop(delivery_id)
+            logger.warning("⚠️ Webhook queue full - rejecting %s event", event_type)
+            raise HTTPException(status_code=503, detail="Server busy")
+        
+        return Response(WEBHOOK_QUEUED_BODY, status_code=202, media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Webhook processing error: {e}")
+        logger.error("❌ Webhook processing error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def read_verified_body(request: Request, signature: str) -> bytes:
+    """
+    Stream the webhook body through the signature HMAC with a hard size cap.
+    
+    Raises:
+        HTTPException: 413 if the body is too large, 401 if the signature is invalid
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_WEBHOOK_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    
+    # Reject malformed signature headers before reading or hashing any of the body
+    hasher = github_manager.create_signature_hasher()
+    expected_digest = decode_webhook_signature(signature) if hasher is not None else None
+    if hasher is not None and expected_digest is None:
+        logger.error("❌ Invalid webhook signature")
+        raise HTTPException(status_code=401, detail="Invalid signature")
+    
+    chunks = []
+    total = 0
+    async for chunk in request.stream():
+        total += len(chunk)
+        if total > MAX_WEBHOOK_BODY_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if hasher is not None:
+            hasher.update(chunk)
+        chunks.append(chunk)
+    
+    if hasher is not None and not hmac.compare_digest(hasher.digest(), expected_digest):
+        logger.error("❌ Invalid webhook signature")
+        raise HTTPException(status_code=401, detail="Invalid signature")
+    
+    return b"".join(chunks)
+
+
+async def webhook_worker(queue: asyncio.Queue):
+    """Parse and process queued webhook events one at a time."""
+    while True:
+        handler, delivery_id, body = await queue.get()
+        try:
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                logger.error("❌ Invalid JSON payload in delivery %s: %s", delivery_id, e)
+                continue
+            
+            await handler(payload)
+        except Exception as e:
+            logger.error("❌ Webhook worker error: %s", e)
+        finally:
+            queue.task_done()
+
+
 async def handle_pull_request(payload: Dict[str, Any]):
     """Handle pull request events."""
     try:
-        logger.info("=== STARTING PULL REQUEST ANALYSIS ===")
-        # Add some delay to ensure the webhook response is returned first
-        await asyncio.sleep(1)
+        logger.debug("=== STARTING PULL REQUEST ANALYSIS ===")
         action = payload.get("action")
         
         # Only process opened and synchronize events
         if action not in ["opened", "synchronize"]:
-            logger.info(f"Skipping PR action: {action}")
+            logger.info("Skipping PR action: %s", action)
             return
         
         # INFINITE LOOP PREVENTION: Check if this is a Qalia-generated commit
@@ -156,74 +287,87 @@ async def handle_pull_request(payload: Dict[str, Any]):
             logger.info("🔄 Detected Qalia-generated commit - skipping analysis to prevent infinite loop")
             return
         
-        # ADDITIONAL LOOP PREVENTION: Check if PR already contains Qalia files
-        repo_name = payload["repository"]["full_name"]
-        pr_number = payload["pull_request"]["number"]
+        # Extract PR information
+        repository = payload["repository"]
+        pr_info = payload["pull_request"]
+        head = pr_info["head"]
+        repo_name = repository["full_name"]
+        pr_number = pr_info["number"]
+        branch = head["ref"]
+        commit_sha = head["sha"]
+        repo_url = repository["clone_url"]
+        installation_id = payload["installation"]["id"]
         
-        # If this is a synchronize event, check if it's likely our own commit
+        # ADDITIONAL LOOP PREVENTION: If this is a synchronize event, check if it's likely our own commit
         if action == "synchronize":
             # Check if PR branch name suggests this is a Qalia update
-            branch_name = payload["pull_request"]["head"]["ref"]
-            if any(keyword in branch_name.lower() for keyword in ["qalia", "test", "generated"]):
-                logger.info(f"🔄 Detected likely Qalia branch update: {branch_name} - skipping to prevent loop")
+            branch_lower = branch.lower()
+            if any(keyword in branch_lower for keyword in ["qalia", "test", "generated"]):
+                logger.info("🔄 Detected likely Qalia branch update: %s - skipping to prevent loop", branch)
                 return
             
             # Check PR title for Qalia signatures
-            pr_title = payload["pull_request"].get("title", "")
+            pr_title = pr_info.get("title", "")
             if any(sig in pr_title for sig in ["🤖", "Qalia", "generated tests", "workflows"]):
-                logger.info(f"🔄 Detected Qalia PR title: '{pr_title}' - skipping to prevent loop")
+                logger.info("🔄 Detected Qalia PR title: '%s' - skipping to prevent loop", pr_title)
                 return
         
-        # Extract PR information
-        pr_info = payload["pull_request"]
-        repo_name = payload["repository"]["full_name"]
-        pr_number = pr_info["number"]
-        branch = pr_info["head"]["ref"]
-        commit_sha = pr_info["head"]["sha"]
-        repo_url = payload["repository"]["clone_url"]
-        installation_id = payload["installation"]["id"]
+        # Marked before analyzing so that a burst of events for this commit runs it once
+        dedup_key = (repo_name, pr_number, commit_sha)
+        if dedup_key in analyzed_pr_commits:
+            logger.info("🔁 Commit %s of PR #%s in %s was already analyzed - skipping", commit_sha[:8], pr_number, repo_name)
+            return
+        analyzed_pr_commits.set(dedup_key)
         
-        logger.info(f"🔍 Analyzing PR #{pr_number} in {repo_name} (branch: {branch})")
+        logger.info("🔍 Analyzing PR #%s in %s (branch: %s)", pr_number, repo_name, branch)
         
-        # Perform QA analysis
-        await perform_qa_analysis(
-            repo_name=repo_name,
-            repo_url=repo_url,
-            branch=branch,
-            commit_sha=commit_sha,
-            pr_number=pr_number,
-            installation_id=installation_id,
-            event_type="pull_request"
-        )
+        # Perform QA analysis; a failed or cancelled run must not block retries
+        succeeded = False
+        try:
+            succeeded = await perform_qa_analysis(
+                repo_name=repo_name,
+                repo_url=repo_url,
+                branch=branch,
+                commit_sha=commit_sha,
+                pr_number=pr_number,
+                installation_id=installation_id,
+                event_type="pull_request",
+                repo_node_id=repository.get("node_id"),
+                pr_node_id=pr_info.get("node_id")
+            )
+        finally:
+            if not succeeded:
+                analyzed_pr_commits.pop(dedup_key)
         
     except Exception as e:
-        logger.error(f"❌ Pull request handling error: {e}")
+        logger.error("❌ Pull request handling error: %s", e)
 
 
 async def handle_push(payload: Dict[str, Any]):
     """Handle push events."""
     try:
-        logger.info("=== STARTING PUSH ANALYSIS ===")
+        logger.debug("=== STARTING PUSH ANALYSIS ===")
         
         # INFINITE LOOP PREVENTION: Check if this is a Qalia-generated commit
         if github_manager.is_qalia_commit(payload):
             logger.info("🔄 Detected Qalia-generated commit - skipping analysis to prevent infinite loop")
             return
         
-        # Only process pushes to main/master branches
+        # Only process pushes to main/master branches (tag pushes never match)
         ref = payload.get("ref", "")
-        if not any(branch in ref for branch in ["main", "master"]):
-            logger.info(f"Skipping push to {ref} - only analyzing main/master branches")
+        branch = ref[len(BRANCH_REF_PREFIX):] if ref.startswith(BRANCH_REF_PREFIX) else ""
+        if branch not in ANALYZED_PUSH_BRANCHES:
+            logger.info("Skipping push to %s - only analyzing main/master branches", ref)
             return
         
         # Extract push information
-        repo_name = payload["repository"]["full_name"]
-        branch = ref.split("/")[-1]  # Extract branch name from refs/heads/branch
+        repository = payload["repository"]
+        repo_name = repository["full_name"]
         commit_sha = payload["head_commit"]["id"]
-        repo_url = payload["repository"]["clone_url"]
+        repo_url = repository["clone_url"]
         installation_id = payload["installation"]["id"]
         
-        logger.info(f"🔍 Analyzing push to {repo_name}:{branch}")
+        logger.info("🔍 Analyzing push to %s:%s", repo_name, branch)
         
         # Perform QA analysis
         await perform_qa_analysis(
@@ -232,11 +376,19 @@ async def handle_push(payload: Dict[str, Any]):
             branch=branch,
             commit_sha=commit_sha,
             installation_id=installation_id,
-            event_type="push"
+            event_type="push",
+            repo_node_id=repository.get("node_id")
         )
         
     except Exception as e:
-        logger.error(f"❌ Push handling error: {e}")
+        logger.error("❌ Push handling error: %s", e)
+
+
+# Webhook event type -> handler coroutine
+EVENT_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+    "pull_request": handle_pull_request,
+    "push": handle_push,
+}
 
 
 async def perform_qa_analysis(
@@ -246,22 +398,43 @@ async def perform_qa_analysis(
     commit_sha: str,
     installation_id: int,
     event_type: str,
-    pr_number: int = None
-):
-    """Perform QA analysis on the repository."""
+    pr_number: int = None,
+    repo_node_id: str = None,
+    pr_node_id: str = None
+) -> bool:
+    """
+    Perform QA analysis on the repository.
+    
+    Returns:
+        True if the results were produced (or reused) and published
+    """
     repo_path = None
     
     try:
-        logger.info(f"🤖 Starting QA analysis for {repo_name}:{branch}")
+        # Reuse results from an earlier analysis of this commit; the generated
+        # tests were already committed then, so only the results are published
+        cached_results = analysis_results_cache.get((repo_name, commit_sha))
+        if cached_results is not None:
+            logger.info("♻️ Reusing analysis results for %s@%s", repo_name, commit_sha[:8])
+            await publish_results(
+                installation_id, commit_sha, cached_results, event_type, repo_node_id, pr_node_id
+            )
+            return True
+        
+        logger.info("🤖 Starting QA analysis for %s:%s", repo_name, branch)
         
-        # Get GitHub client and access token
-        g, access_token = github_manager.get_client(installation_id)
+        # Get the installation access token
+        access_token = await github_manager.get_installation_token(installation_id)
         
         # Clone repository
-        repo_path = await github_manager.clone_repository(repo_url, branch, access_token)
+        repo_path = await github_manager.clone_repository(repo_url, branch, access_token, commit_sha)
         if not repo_path:
             logger.error("❌ Failed to clone repository")
-            return
+            return False
+        
+        # The checkout falls back to the branch tip when the event's commit is gone,
+        # so results are cached under the commit that was actually analyzed
+        analyzed_sha = github_manager.get_checked_out_sha(repo_path)
         
         # Run QA analysis
         logger.info("🔍 Running Qalia AI analysis...")
@@ -272,14 +445,15 @@ async def perform_qa_analysis(
         
         if not analysis_results:
             logger.error("❌ QA analysis failed")
-            return
+            return False
         
         logger.info("✅ QA analysis completed successfully")
         
         # Commit generated tests and workflows
         frameworks = analysis_results.get("test_frameworks", [])
+        committed = True
         if frameworks:
-            logger.info(f"📝 Committing tests for frameworks: {frameworks}")
+            logger.info("📝 Committing tests for frameworks: %s", frameworks)
             
             success = await github_manager.commit_tests_and_workflows(
                 repo_path=repo_path,
@@ -302,26 +476,48 @@ async def perform_qa_analysis(
                 )
             else:
                 logger.error("❌ Failed to commit tests and workflows")
+            committed = success
         
-        # Create GitHub check run (TODO: implement in GitHubManager)
-        # await github_manager.create_check_run(repo_name, commit_sha, analysis_results)
+        # Only fully successful runs are reused; a failed commit should be retried
+        if committed and analyzed_sha:
+            analysis_results_cache.set((repo_name, analyzed_sha), analysis_results)
         
-        # Comment on PR if this is a PR event (TODO: implement in GitHubManager)
-        # if event_type == "pull_request" and pr_number:
-        #     await github_manager.comment_on_pr(repo_name, pr_number, analysis_results)
+        await publish_results(
+            installation_id, commit_sha, analysis_results, event_type, repo_node_id, pr_node_id
+        )
         
         logger.info("🎉 QA analysis pipeline completed successfully")
+        return committed
                 
     except Exception as e:
-        logger.error(f"❌ QA analysis error: {e}")
+        logger.error("❌ QA analysis error: %s", e)
+        return False
     
     finally:
-        # Cleanup cloned repository
-        if repo_path and os.path.exists(repo_path):
-            import shutil
-            shutil.rmtree(repo_path, ignore_errors=True)
-            logger.info(f"🧹 Cleaned up temporary repository: {repo_path}")
-    
+        # Cleanup repository worktree (release() also unregisters worktrees whose directory is gone)
+        if repo_path:
+            await github_manager.release_repository(repo_path)
+            logger.info("🧹 Cleaned up temporary repository: %s", repo_path)
+
+
+async def publish_results(
+    installation_id: int,
+    commit_sha: str,
+    analysis_results: Dict[str, Any],
+    event_type: str,
+    repo_node_id: str = None,
+    pr_node_id: str = None
+):
+    """Create the check run and PR comment in a single GraphQL request."""
+    config = get_app_config()
+    await github_manager.publish_analysis_results(
+        installation_id=installation_id,
+        commit_sha=commit_sha,
+        analysis_results=analysis_results,
+        repo_node_id=repo_node_id if config["enable_check_runs"] else None,
+        pr_node_id=pr_node_id if event_type == "pull_request" and config["enable_pr_comments"] else None
+    )
+
 
 if __name__ == "__main__":
     # Run the server
@@ -329,10 +525,14 @@ if __name__ == "__main__":
     
     logger.info(f"🚀 Starting Qalia QA AI server on port {port}")
     
+    # Pass the app object so uvicorn does not import this module a second time
     uvicorn.run(
-        "app:app",
+        app,
         host="0.0.0.0",
         port=port,
         reload=False,
-        log_level="info"
+        log_level=LOG_LEVEL.lower(),
+        # C event loop and HTTP parser; uvloop is unavailable on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     ) 
\ No newline at end of file
@@ -6,6 +6,7 @@ based on repository information and common hosting patterns.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import logging
 
@@ -56,8 +57,14 @@ def get_deployment_url(repo_name: str, branch: str = "main") -> str:
         f"or DEFAULT_DEPLOY_URL environment variable, or use qalia.yml configuration."
     )
 
+@lru_cache(maxsize=1)
 def get_app_config() -> Dict[str, Any]:
-    """Get application configuration from environment variables."""
+    """
+    Get application configuration from environment variables.
+    
+    The environment is read once per process; callers must not mutate the
+    returned dict. Use get_app_config.cache_clear() to reload it.
+    """
     return {
         "github_app_id": os.getenv("GITHUB_APP_ID"),
         "github_webhook_secret": os.getenv("GITHUB_WEBHOOK_SECRET"),
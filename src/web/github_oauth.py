@@ -5,12 +5,14 @@ Handles GitHub OAuth 2.0 authentication for web users.
 This is separate from the GitHub App authentication used for automated operations.
 """
 
+import asyncio
 import os
 import secrets
 import logging
 from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlencode
 
+import httpx
 import requests
 from github import Github
 
@@ -34,6 +36,19 @@ class GitHubOAuth:
         self.redirect_uri = redirect_uri
         self.base_url = "https://github.com"
         self.api_url = "https://api.github.com"
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, created on first use so idle managers hold no connections."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=10.0)
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client; call from the owning app's shutdown hook."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     def generate_auth_url(self, scopes: list = None) -> Tuple[str, str]:
         """
@@ -103,7 +118,7 @@ class GitHubOAuth:
         }
         
         try:
-            response = requests.post(token_url, data=data, headers=headers, timeout=10)
+            response = await self._get_http_client().post(token_url, data=data, headers=headers)
             response.raise_for_status()
             
             token_data = response.json()
@@ -119,7 +134,7 @@ class GitHubOAuth:
             logger.info("OAuth token exchange successful")
             return token_data
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"OAuth token exchange failed: {e}")
             return None
     
@@ -140,13 +155,15 @@ class GitHubOAuth:
         }
         
         try:
-            # Get user info
-            user_response = requests.get(f"{self.api_url}/user", headers=headers, timeout=10)
+            # Get user info and emails concurrently
+            client = self._get_http_client()
+            user_response, emails_response = await asyncio.gather(
+                client.get(f"{self.api_url}/user", headers=headers),
+                client.get(f"{self.api_url}/user/emails", headers=headers)
+            )
             user_response.raise_for_status()
             user_data = user_response.json()
             
-            # Get user emails
-            emails_response = requests.get(f"{self.api_url}/user/emails", headers=headers, timeout=10)
             emails_response.raise_for_status()
             emails_data = emails_response.json()
             
@@ -179,7 +196,7 @@ class GitHubOAuth:
             logger.info(f"Retrieved user info for: {user_info['login']}")
             return user_info
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get user info: {e}")
             return None
     
@@ -195,47 +212,8 @@ class GitHubOAuth:
             List of repository dicts
         """
         try:
-            # Use PyGitHub for easier repository management
-            g = Github(access_token)
-            user = g.get_user()
-            
-            repositories = []
-            
-            # Get user's own repositories
-            for repo in user.get_repos(type="all", sort="updated", per_page=per_page):
-                repo_data = {
-                    "id": repo.id,
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "private": repo.private,
-                    "html_url": repo.html_url,
-                    "clone_url": repo.clone_url,
-                    "ssh_url": repo.ssh_url,
-                    "default_branch": repo.default_branch,
-                    "language": repo.language,
-                    "languages_url": repo.languages_url,
-                    "stargazers_count": repo.stargazers_count,
-                    "watchers_count": repo.watchers_count,
-                    "forks_count": repo.forks_count,
-                    "size": repo.size,
-                    "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                    "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                    "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
-                    "permissions": {
-                        "admin": repo.permissions.admin,
-                        "push": repo.permissions.push,
-                        "pull": repo.permissions.pull
-                    },
-                    "owner": {
-                        "login": repo.owner.login,
-                        "avatar_url": repo.owner.avatar_url,
-                        "html_url": repo.owner.html_url,
-                        "type": repo.owner.type
-                    }
-                }
-                repositories.append(repo_data)
-            
+            # PyGithub pages through the listing with blocking requests, so walk it in a worker thread
+            repositories = await asyncio.to_thread(self._list_user_repositories, access_token, per_page)
             logger.info(f"Retrieved {len(repositories)} repositories for user")
             return repositories
             
@@ -243,6 +221,51 @@ class GitHubOAuth:
             logger.error(f"Failed to get user repositories: {e}")
             return []
     
+    def _list_user_repositories(self, access_token: str, per_page: int) -> list:
+        """Fetch the user's repositories with PyGithub (blocking)."""
+        # Use PyGitHub for easier repository management
+        g = Github(access_token)
+        user = g.get_user()
+        
+        repositories = []
+        
+        # Get user's own repositories
+        for repo in user.get_repos(type="all", sort="updated", per_page=per_page):
+            repo_data = {
+                "id": repo.id,
+                "name": repo.name,
+                "full_name": repo.full_name,
+                "description": repo.description,
+                "private": repo.private,
+                "html_url": repo.html_url,
+                "clone_url": repo.clone_url,
+                "ssh_url": repo.ssh_url,
+                "default_branch": repo.default_branch,
+                "language": repo.language,
+                "languages_url": repo.languages_url,
+                "stargazers_count": repo.stargazers_count,
+                "watchers_count": repo.watchers_count,
+                "forks_count": repo.forks_count,
+                "size": repo.size,
+                "created_at": repo.created_at.isoformat() if repo.created_at else None,
+                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
+                "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
+                "permissions": {
+                    "admin": repo.permissions.admin,
+                    "push": repo.permissions.push,
+                    "pull": repo.permissions.pull
+                },
+                "owner": {
+                    "login": repo.owner.login,
+                    "avatar_url": repo.owner.avatar_url,
+                    "html_url": repo.owner.html_url,
+                    "type": repo.owner.type
+                }
+            }
+            repositories.append(repo_data)
+        
+        return repositories
+    
     def validate_token(self, access_token: str) -> bool:
         """
         Validate if an access token is still valid.
@@ -282,7 +305,11 @@ def get_oauth_config() -> Dict[str, str]:
 
 
 def create_oauth_manager() -> GitHubOAuth:
-    """Create and configure GitHub OAuth manager."""
+    """
+    Create and configure GitHub OAuth manager.
+    
+    The caller owns the manager and must await its aclose() on shutdown.
+    """
     config = get_oauth_config()
     return GitHubOAuth(
         client_id=config["client_id"],
@@ -9,26 +9,109 @@ Handles all GitHub-related functionality including:
 - Workflow triggering
 """
 
+from __future__ import annotations
+
+import asyncio
 import os
 import shutil
-import tempfile
 import subprocess
 import time
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
+from functools import lru_cache
 
+import binascii
 import hmac
 import hashlib
+import httpx
 import jwt
-import requests
-from github import Github
+import orjson
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
+from src.web.repo_cache import RepoCache, git_auth_env, remove_tree, run_git
 from src.web.workflow_generator import WorkflowGenerator
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# App JWTs are valid for 10 minutes; installation tokens for about an hour.
+# Installation tokens are refreshed early because the same token is used for
+# the git push at the end of a multi-minute analysis.
+APP_JWT_LIFETIME = 600
+APP_JWT_REFRESH_MARGIN = 30
+INSTALLATION_TOKEN_REFRESH_MARGIN = 300
+
+# Retries for API calls rejected by GitHub's primary or secondary rate limits;
+# waits longer than the cap (an exhausted hourly quota) fail instead of
+# holding a webhook worker
+GITHUB_RATE_LIMIT_RETRIES = 6
+GITHUB_RATE_LIMIT_MAX_WAIT = 60
+# Retries never fire back-to-back, even when the reset time has already
+# passed; GitHub asks for a minute when a secondary limit gives no time
+GITHUB_RATE_LIMIT_MIN_WAIT = 1.0
+GITHUB_SECONDARY_RATE_LIMIT_WAIT = 60.0
+
+# Locations searched for the GitHub App private key when GITHUB_PRIVATE_KEY is unset
+PRIVATE_KEY_PATHS = (Path("private-key.pem"), Path("app/private-key.pem"))
+
+# Markdown templates for published analysis results
+ANALYSIS_TITLE_TEMPLATE = "Qalia QA Analysis: {status}"
+ANALYSIS_SUMMARY_TEMPLATE = (
+    "- **Status:** {status}\n"
+    "- **Test cases generated:** {total_tests}\n"
+    "- **Frameworks:** {frameworks}"
+)
+ANALYSIS_ERROR_TEMPLATE = "\n- **Error:** {error}"
+PR_COMMENT_TEMPLATE = "## 🤖 {title}\n\n{summary}"
+
+# Commit created for generated tests; is_qalia_commit() matches its first line
+COMMIT_MESSAGE_TEMPLATE = """🤖 Add Qalia generated tests and workflows
+
+- Generated test files for {frameworks} frameworks
+- Added GitHub Actions workflows for automated testing
+- Tests can be run individually or as a complete suite
+
+Generated by Qalia.ai on {timestamp}"""
+
+# Keeps installed dependencies and test artifacts out of the generated-tests commit
+QALIA_TESTS_GITIGNORE = """# Node.js dependencies - should not be committed
+node_modules/
+*/node_modules/
+package-lock.json
+*/package-lock.json
+
+# Test results and artifacts
+test-results/
+*/test-results/
+playwright-report/
+*/playwright-report/
+coverage/
+*/coverage/
+
+# Temporary files
+*.log
+.DS_Store
+.env
+"""
+
+# Mutation fields used to publish analysis results in a single GraphQL request
+CHECK_RUN_MUTATION_FIELD = """
+  createCheckRun(input: {
+    repositoryId: $repositoryId,
+    headSha: $headSha,
+    name: "Qalia QA Analysis",
+    status: COMPLETED,
+    conclusion: $conclusion,
+    output: {title: $title, summary: $summary}
+  }) { checkRun { id } }"""
+
+ADD_COMMENT_MUTATION_FIELD = """
+  addComment(input: {subjectId: $subjectId, body: $body}) { commentEdge { node { id } } }"""
+
 
 class GitHubManager:
     """Manages all GitHub operations for the Qalia application."""
@@ -44,118 +127,168 @@ class GitHubManager:
         """
         self.app_id = app_id
         self.private_key = private_key
+        # Parse the PEM once so JWT signing reuses the RSA key object
+        self._signing_key = load_pem_private_key(private_key.encode("utf-8"), password=None)
         self.webhook_secret = webhook_secret
+        # Key the HMAC once; each webhook copies it instead of re-deriving the pads
+        self._signature_hmac = (
+            hmac.new(webhook_secret.encode("utf-8"), digestmod=hashlib.sha256) if webhook_secret else None
+        )
         self._qalia_commit_shas = set()  # Initialize set to track Qalia commits
+        
+        # App JWT and per-installation access tokens are reused until shortly
+        # before they expire instead of being minted on every webhook; each
+        # installation has its own lock so concurrent webhooks mint only once
+        self._token_locks: Dict[int, asyncio.Lock] = {}
+        self._app_jwt: Optional[str] = None
+        self._app_jwt_expires_at = 0.0
+        self._installation_tokens: Dict[int, Tuple[str, float]] = {}
+        # Time until which requests for an installation should hold off, shared
+        # so concurrent webhooks back off together once one is rate limited;
+        # entries are dropped once their deadline has passed
+        self._rate_limited_until: Dict[int, float] = {}
+        
+        self.repo_cache = RepoCache()
+        self._http_client: Optional[httpx.AsyncClient] = None
     
     def verify_webhook_signature(self, request_body: bytes, signature: str) -> bool:
         """Verify the webhook signature from GitHub."""
-        if not self.webhook_secret:
+        hasher = self.create_signature_hasher()
+        if hasher is None:
             return True  # Skip verification if no secret is set
         
-        expected_signature = hmac.new(
-            self.webhook_secret.encode(),
-            request_body,
-            hashlib.sha256
-        ).hexdigest()
+        # Reject malformed headers before hashing the body
+        if decode_webhook_signature(signature) is None:
+            return False
         
-        return hmac.compare_digest(f"sha256={expected_signature}", signature)
+        hasher.update(request_body)
+        return self.verify_signature_digest(hasher.digest(), signature)
     
-    def get_client(self, installation_id: int) -> Tuple[Github, str]:
+    def create_signature_hasher(self) -> Optional["hmac.HMAC"]:
         """
-        Get an authenticated GitHub client for the installation.
+        Create an incremental HMAC for verifying a streamed request body.
+        
+        Returns:
+            HMAC-SHA256 object keyed with the webhook secret, or None if
+            signature verification is disabled
+        """
+        if self._signature_hmac is None:
+            return None
+        return self._signature_hmac.copy()
+    
+    def verify_signature_digest(self, digest: bytes, signature: str) -> bool:
+        """Compare a computed HMAC-SHA256 digest with the X-Hub-Signature-256 header."""
+        signature_bytes = decode_webhook_signature(signature)
+        if signature_bytes is None:
+            return False
+        return hmac.compare_digest(digest, signature_bytes)
+    
+    async def get_installation_token(self, installation_id: int) -> str:
+        """
+        Get an access token for the installation.
         
         Args:
             installation_id: GitHub App installation ID
             
         Returns:
-            Tuple of (GitHub client, access token)
+            Installation access token, reused until shortly before it expires
         """
         if not self.app_id:
             raise ValueError("GitHub App ID not configured")
         
-        # Generate JWT
-        now = int(time.time())
+        return await self._get_installation_token(installation_id)
+    
+    def _get_app_jwt(self) -> str:
+        """Return the app JWT, re-signing it only when it is about to expire."""
+        now = time.time()
+        if self._app_jwt and now < self._app_jwt_expires_at - APP_JWT_REFRESH_MARGIN:
+            return self._app_jwt
+        
+        issued_at = int(now)
         payload = {
-            "iat": now,
-            "exp": now + 600,  # 10 minutes
+            "iat": issued_at,
+            "exp": issued_at + APP_JWT_LIFETIME,
             "iss": self.app_id
         }
         
-        jwt_token = jwt.encode(
+        self._app_jwt = jwt.encode(
             payload,
-            self.private_key,
+            self._signing_key,
             algorithm="RS256"
         )
-        
-        # Get installation access token using direct API call
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "Qalia-GitHub-App"
-        }
-        
-        response = requests.post(
-            f"https://api.github.com/app/installations/{installation_id}/access_tokens",
-            headers=headers
-        )
-        
-        if response.status_code != 201:
-            raise RuntimeError(
-                f"Failed to get installation token: {response.status_code} {response.text}"
+        self._app_jwt_expires_at = issued_at + APP_JWT_LIFETIME
+        return self._app_jwt
+    
+    async def _get_installation_token(self, installation_id: int) -> str:
+        """Return a cached installation access token, requesting a new one when stale."""
+        cached = self._installation_tokens.get(installation_id)
+        if cached and time.time() < cached[1] - INSTALLATION_TOKEN_REFRESH_MARGIN:
+            return cached[0]
+        
+        async with self._token_locks.setdefault(installation_id, asyncio.Lock()):
+            # Another webhook may have refreshed the token while we waited
+            cached = self._installation_tokens.get(installation_id)
+            if cached and time.time() < cached[1] - INSTALLATION_TOKEN_REFRESH_MARGIN:
+                return cached[0]
+            
+            # Get installation access token using direct API call
+            response = await self._get_http_client().post(
+                f"/app/installations/{installation_id}/access_tokens",
+                headers={"Authorization": f"Bearer {self._get_app_jwt()}"}
             )
-        
-        token_data = response.json()
-        access_token = token_data["token"]
-        
-        # Return client with installation token and the token itself
-        return Github(access_token), access_token
+            
+            if response.status_code != 201:
+                raise RuntimeError(
+                    f"Failed to get installation token: {response.status_code} {response.text}"
+                )
+            
+            token_data = orjson.loads(response.content)
+            access_token = token_data["token"]
+            expires_at = _parse_github_timestamp(token_data.get("expires_at"))
+            self._installation_tokens[installation_id] = (access_token, expires_at)
+            return access_token
     
-    async def clone_repository(self, repo_url: str, branch: str = "main", access_token: Optional[str] = None) -> Optional[str]:
+    async def clone_repository(
+        self,
+        repo_url: str,
+        branch: str = "main",
+        access_token: Optional[str] = None,
+        commit_sha: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Clone a repository to a temporary directory.
+        Check out a repository into a temporary worktree.
+        
+        The repository is mirrored once in the repo cache and each call only
+        fetches the branch tip (shallow, blobs on demand) before adding a
+        detached worktree.
         
         Args:
             repo_url: Repository URL to clone
-            branch: Branch to clone
+            branch: Branch to check out when no commit SHA is given
             access_token: Optional access token for authentication
+            commit_sha: Optional commit to check out instead of the branch head
             
         Returns:
-            Path to cloned repository or None if failed
+            Path to the checked out repository or None if failed
         """
-        temp_dir = tempfile.mkdtemp()
-        
         try:
-            # Prepare the URL with authentication if token is provided
-            if access_token:
-                # Parse the URL and inject the token
-                if repo_url.startswith("https://github.com/"):
-                    auth_url = repo_url.replace("https://", f"https://x-access-token:{access_token}@")
-                else:
-                    auth_url = repo_url
-            else:
-                auth_url = repo_url
-            
-            # Clone the repository
-            result = subprocess.run(
-                ["git", "clone", "-b", branch, auth_url, temp_dir],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"Failed to clone repository: {result.stderr}")
-                return None
-            
-            logger.info(f"Repository cloned successfully to: {temp_dir}")
-            return temp_dir
+            repo_path = await self.repo_cache.checkout(repo_url, branch, commit_sha, access_token)
+            if repo_path:
+                logger.info("Repository checked out successfully to: %s", repo_path)
+            return repo_path
         
         except Exception as e:
-            logger.error(f"Exception during repository cloning: {e}")
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.error("Exception during repository cloning: %s", e)
             return None
     
+    def get_checked_out_sha(self, repo_path: str) -> Optional[str]:
+        """Return the commit checked out in a clone_repository() worktree, or None if unknown."""
+        return _read_head_sha(Path(repo_path))
+    
+    async def release_repository(self, repo_path: str) -> None:
+        """Remove a repository checkout created by clone_repository()."""
+        await self.repo_cache.release(repo_path)
+    
     async def commit_tests_and_workflows(
         self,
         repo_path: str, 
@@ -186,14 +319,18 @@ class GitHubManager:
             
             # Check if tests are already in the correct location
             if source_tests.resolve() == target_tests.resolve():
-                logger.info(f"Tests already in correct location: {target_tests}")
+                logger.info("Tests already in correct location: %s", target_tests)
             elif source_tests.exists():
-                if target_tests.exists():
-                    shutil.rmtree(target_tests)
-                shutil.copytree(source_tests, target_tests)
-                logger.info(f"Copied generated tests to {target_tests}")
+                # remove_tree ignores a missing target, so no separate existence check
+                await remove_tree(target_tests)
+                try:
+                    # Same filesystem: move the directory entry instead of copying every file
+                    os.rename(source_tests, target_tests)
+                except OSError:
+                    await asyncio.to_thread(shutil.copytree, source_tests, target_tests)
+                logger.info("Moved generated tests to %s", target_tests)
             else:
-                logger.warning(f"Source test directory not found: {source_tests}")
+                logger.warning("Source test directory not found: %s", source_tests)
                 # Tests might already be in target location, continue anyway
             
             # Generate GitHub Actions workflows
@@ -202,89 +339,201 @@ class GitHubManager:
             matrix_workflow = generator.create_test_integration_workflow("qalia-tests")
             workflows.append(matrix_workflow)
             
-            logger.info(f"Generated {len(workflows)} workflow files")
-            
-            # Configure git user (required for commits)
-            subprocess.run(["git", "config", "user.name", "Qalia AI"], 
-                          cwd=repo_path, check=True)
-            subprocess.run(["git", "config", "user.email", "qalia@ai-generated.com"], 
-                          cwd=repo_path, check=True)
-            
-            # Check if there are any changes to commit
-            status_result = subprocess.run(["git", "status", "--porcelain"], 
-                                         cwd=repo_path, capture_output=True, text=True)
-            
-            if not status_result.stdout.strip():
-                logger.info("No changes to commit - tests and workflows are up to date")
-                return True
+            logger.info("Generated %s workflow files", len(workflows))
             
             # PREVENT NODE_MODULES COMMITS: Create .gitignore in qalia-tests directory
-            qalia_tests_dir = os.path.join(repo_path, "qalia-tests")
-            if os.path.exists(qalia_tests_dir):
+            if target_tests.is_dir():
                 # Remove any existing node_modules from git tracking
-                try:
-                    subprocess.run(["git", "rm", "-r", "--cached", "qalia-tests/*/node_modules"], 
-                                  cwd=repo_path, capture_output=True)
-                    logger.info("Removed node_modules directories from git tracking")
-                except subprocess.CalledProcessError:
-                    # node_modules might not exist in git yet, which is fine
-                    pass
+                # (node_modules might not exist in git yet, which is fine)
+                await run_git(["rm", "-r", "--cached", "qalia-tests/*/node_modules"], cwd=repo_path)
+                logger.info("Removed node_modules directories from git tracking")
                 
-                gitignore_path = os.path.join(qalia_tests_dir, ".gitignore")
-                gitignore_content = """# Node.js dependencies - should not be committed
-node_modules/
-*/node_modules/
-package-lock.json
-*/package-lock.json
-
-# Test results and artifacts
-test-results/
-*/test-results/
-playwright-report/
-*/playwright-report/
-coverage/
-*/coverage/
-
-# Temporary files
-*.log
-.DS_Store
-.env
-"""
-                with open(gitignore_path, 'w', encoding='utf-8') as f:
-                    f.write(gitignore_content)
+                gitignore_path = target_tests / ".gitignore"
+                gitignore_path.write_text(QALIA_TESTS_GITIGNORE, encoding="utf-8")
                 logger.info("Created .gitignore in qalia-tests directory to prevent node_modules commits")
             
             # Add all changes
-            subprocess.run(["git", "add", "qalia-tests/", ".github/workflows/qalia-*.yml"], 
-                          cwd=repo_path, check=True)
+            await run_git(["add", "qalia-tests/", ".github/workflows/qalia-*.yml"], cwd=repo_path, check=True)
+            
+            # Check if anything was staged; this only compares the index, unlike a full worktree status scan
+            diff_result = await run_git(["diff", "--cached", "--quiet"], cwd=repo_path)
+            if diff_result.returncode == 0:
+                logger.info("No changes to commit - tests and workflows are up to date")
+                return True
             
             # Create commit message
-            commit_message = f"""🤖 Add Qalia generated tests and workflows
-
-- Generated test files for {', '.join(frameworks)} frameworks
-- Added GitHub Actions workflows for automated testing
-- Tests can be run individually or as a complete suite
-
-Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
+            commit_message = COMMIT_MESSAGE_TEMPLATE.format(
+                frameworks=", ".join(frameworks),
+                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
             
             # Commit changes
-            subprocess.run(["git", "commit", "-m", commit_message], 
-                          cwd=repo_path, check=True)
+            # The committer identity is passed inline rather than written to the shared mirror config
+            await run_git(
+                ["-c", "user.name=Qalia AI", "-c", "user.email=qalia@ai-generated.com", "commit", "-m", commit_message],
+                cwd=repo_path,
+                check=True
+            )
+            
+            # Remember our own commit so the webhook it triggers is skipped by exact SHA
+            commit_sha = _read_head_sha(repo_path)
+            if commit_sha:
+                self._qalia_commit_shas.add(commit_sha)
             
             # Push to remote
-            subprocess.run(["git", "push", "origin", branch], 
-                          cwd=repo_path, check=True)
+            await run_git(
+                ["push", "origin", f"HEAD:refs/heads/{branch}"],
+                cwd=repo_path,
+                timeout=300,
+                check=True,
+                env=git_auth_env(access_token)
+            )
             
             logger.info("Successfully committed and pushed generated tests and workflows")
             return True
             
         except subprocess.CalledProcessError as e:
-            logger.error(f"Git operation failed: {e}")
+            logger.error("Git operation failed: %s %s", e, e.stderr)
             return False
         except Exception as e:
-            logger.error(f"Failed to commit tests and workflows: {e}")
+            logger.error("Failed to commit tests and workflows: %s", e)
             return False
     
+    async def publish_analysis_results(
+        self,
+        installation_id: int,
+        commit_sha: str,
+        analysis_results: Dict[str, Any],
+        repo_node_id: Optional[str] = None,
+        pr_node_id: Optional[str] = None
+    ) -> bool:
+        """
+        Create a check run and PR comment with QA AI results in one GraphQL request.
+        
+        Args:
+            installation_id: GitHub App installation ID
+            commit_sha: Commit SHA to create the check run for
+            analysis_results: Analysis results from QA AI
+            repo_node_id: GraphQL node ID of the repository (skips the check run if None)
+            pr_node_id: GraphQL node ID of the pull request (skips the comment if None)
+            
+        Returns:
+            True if the results were published successfully
+        """
+        declarations = []
+        fields = []
+        variables: Dict[str, Any] = {}
+        title, summary = _format_analysis_summary(analysis_results)
+        
+        if repo_node_id:
+            declarations.append(
+                "$repositoryId: ID!, $headSha: GitObjectID!, "
+                "$conclusion: CheckConclusionState!, $title: String!, $summary: String!"
+            )
+            fields.append(CHECK_RUN_MUTATION_FIELD)
+            variables.update({
+                "repositoryId": repo_node_id,
+                "headSha": commit_sha,
+                "conclusion": "SUCCESS" if analysis_results.get("status") == "success" else "NEUTRAL",
+                "title": title,
+                "summary": summary
+            })
+        
+        if pr_node_id:
+            declarations.append("$subjectId: ID!, $body: String!")
+            fields.append(ADD_COMMENT_MUTATION_FIELD)
+            variables.update({
+                "subjectId": pr_node_id,
+                "body": PR_COMMENT_TEMPLATE.format(title=title, summary=summary)
+            })
+        
+        if not fields:
+            return True
+        
+        query = f"mutation({', '.join(declarations)}) {{{''.join(fields)}\n}}"
+        
+        try:
+            response = await self._github_post(
+                GITHUB_GRAPHQL_URL,
+                installation_id,
+                content=orjson.dumps({"query": query, "variables": variables})
+            )
+            result = orjson.loads(response.content)
+            
+            if response.status_code != 200 or result.get("errors"):
+                logger.error("Failed to publish analysis results: %s %s", response.status_code, result.get('errors'))
+                return False
+            
+            logger.info("✅ Published analysis results to GitHub")
+            return True
+            
+        except Exception as e:
+            logger.error("Failed to publish analysis results: %s", e)
+            return False
+    
+    async def _github_post(self, url: str, installation_id: int, **kwargs) -> httpx.Response:
+        """
+        POST to the GitHub API as an installation, waiting out rate limits.
+        
+        Rate-limited responses are retried after their Retry-After or reset
+        time (at least a second), or after a minute when neither is given.
+        
+        Returns:
+            The last response received
+        """
+        client = self._get_http_client()
+        
+        for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+            delay = self._rate_limited_until.get(installation_id, 0.0) - time.time()
+            if 0 < delay <= GITHUB_RATE_LIMIT_MAX_WAIT:
+                await asyncio.sleep(delay)
+            
+            # Fetched per attempt so a long wait never outlives the token
+            access_token = await self.get_installation_token(installation_id)
+            headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+            response = await client.post(url, headers=headers, **kwargs)
+            wait = _rate_limit_wait(response)
+            if wait is None:
+                self._rate_limited_until.pop(installation_id, None)
+                return response
+            
+            self._set_rate_limited(installation_id, wait)
+            if wait > GITHUB_RATE_LIMIT_MAX_WAIT or attempt == GITHUB_RATE_LIMIT_RETRIES:
+                break
+            logger.warning("⏳ GitHub rate limit hit for %s, retrying in %.0fs", url, wait)
+        
+        logger.error("GitHub rate limit exceeded for %s", url)
+        return response
+    
+    def _set_rate_limited(self, installation_id: int, wait: float) -> None:
+        """Hold off requests for an installation, dropping deadlines that have already passed."""
+        now = time.time()
+        for expired in [key for key, until in self._rate_limited_until.items() if until <= now]:
+            del self._rate_limited_until[expired]
+        self._rate_limited_until[installation_id] = now + wait
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client used for GitHub API requests."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "User-Agent": "Qalia-GitHub-App"
+                },
+                timeout=30
+            )
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and remove leftover repository checkouts."""
+        await self.repo_cache.close()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def create_check_run(self, repo_name: str, commit_sha: str, analysis_results: Dict[str, Any]) -> None:
         """
         Create a GitHub check run with QA AI results.
@@ -333,47 +582,28 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             True if workflows were triggered successfully
         """
         try:
-            g, _ = self.get_client(installation_id)
-            repo = g.get_repo(repo_name)
-            
-            # Trigger each framework workflow
-            for framework in frameworks:
-                try:
-                    # Use repository dispatch to trigger workflow
-                    repo.create_repository_dispatch(
-                        event_type=f"qalia-test-{framework}",
-                        client_payload={
-                            "framework": framework,
-                            "commit_sha": commit_sha,
-                            "branch": branch,
-                            "triggered_by": "qalia_analysis"
-                        }
-                    )
-                    logger.info(f"✅ Triggered {framework} test workflow")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to trigger {framework} workflow: {e}")
-            
-            # Also trigger the matrix workflow
-            try:
-                repo.create_repository_dispatch(
-                    event_type="qalia-test-matrix",
-                    client_payload={
+            # Dispatch straight through the shared client; PyGithub would first GET the repository.
+            # One matrix event runs every framework, so the per-framework
+            # workflows are not dispatched separately
+            response = await self._github_post(
+                f"/repos/{repo_name}/dispatches",
+                installation_id,
+                content=orjson.dumps({
+                    "event_type": "qalia-test-matrix",
+                    "client_payload": {
                         "frameworks": frameworks,
                         "commit_sha": commit_sha,
                         "branch": branch,
                         "triggered_by": "qalia_analysis"
                     }
-                )
-                logger.info("✅ Triggered matrix test workflow")
-                
-            except Exception as e:
-                logger.error(f"Failed to trigger matrix workflow: {e}")
-            
+                })
+            )
+            response.raise_for_status()
+            logger.info("✅ Triggered matrix test workflow for %s", ", ".join(frameworks))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to trigger test workflows: {e}")
+            logger.error("Failed to trigger test workflows: %s", e)
             return False
     
     def is_qalia_commit(self, payload: Dict[str, Any]) -> bool:
@@ -390,12 +620,12 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             # First, try to get commit SHA for precise checking
             commit_sha = self._extract_commit_sha(payload)
             if commit_sha:
-                logger.debug(f"Checking commit SHA: {commit_sha}")
+                logger.debug("Checking commit SHA: %s", commit_sha)
                 
                 # Store recent Qalia commit SHAs to check against
                 if hasattr(self, '_qalia_commit_shas'):
                     if commit_sha in self._qalia_commit_shas:
-                        logger.info(f"🎯 Found exact match for Qalia commit SHA: {commit_sha[:8]}")
+                        logger.info("🎯 Found exact match for Qalia commit SHA: %s", commit_sha[:8])
                         return True
                 else:
                     self._qalia_commit_shas = set()
@@ -410,11 +640,11 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
                 # PRECISE CHECK: Use head commit SHA to get exact commit info
                 head_sha = pr.get("head", {}).get("sha")
                 if head_sha:
-                    logger.debug(f"PR head commit SHA: {head_sha}")
+                    logger.debug("PR head commit SHA: %s", head_sha)
                     
                     # Check if this SHA matches any of our recent Qalia commits
                     if hasattr(self, '_qalia_commit_shas') and head_sha in self._qalia_commit_shas:
-                        logger.info(f"🎯 PR head SHA matches Qalia commit: {head_sha[:8]}")
+                        logger.info("🎯 PR head SHA matches Qalia commit: %s", head_sha[:8])
                         return True
                 
                 # Try multiple paths for PR commit info
@@ -438,7 +668,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
                     # Get file changes from PR (if available)
                     changed_files = self._extract_changed_files_from_pr(payload)
                     if changed_files and self._are_qalia_only_changes(changed_files):
-                        logger.info(f"🎯 PR contains only Qalia file changes: {changed_files}")
+                        logger.info("🎯 PR contains only Qalia file changes: %s", changed_files)
                         return True
                         
                     # Create minimal commit info for further checking
@@ -458,7 +688,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
                     if not hasattr(self, '_qalia_commit_shas'):
                         self._qalia_commit_shas = set()
                     self._qalia_commit_shas.add(commit_sha)
-                    logger.debug(f"Stored Qalia commit SHA: {commit_sha[:8]}")
+                    logger.debug("Stored Qalia commit SHA: %s", commit_sha[:8])
             
             # For commits array in push events
             elif "commits" in payload and isinstance(payload["commits"], list) and payload["commits"]:
@@ -472,7 +702,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             return self._is_qalia_commit_info(commit_info)
             
         except Exception as e:
-            logger.error(f"Error in infinite loop detection: {e}")
+            logger.error("Error in infinite loop detection: %s", e)
             # If we can't determine, err on the side of caution and allow the commit
             return False
     
@@ -528,7 +758,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         """Check if commit info indicates this is a Qalia commit."""
         # Check commit message for Qalia signatures
         commit_message = commit_info.get("message", "")
-        logger.debug(f"Checking commit message for Qalia signatures: '{commit_message[:100]}...'")
+        logger.debug("Checking commit message for Qalia signatures: '%s...'", commit_message[:100])
         
         qalia_signatures = [
             "🤖 Add Qalia generated tests and workflows",
@@ -540,7 +770,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         
         for signature in qalia_signatures:
             if signature in commit_message:
-                logger.info(f"🎯 Detected Qalia commit signature: '{signature}' in message: '{commit_message[:100]}...'")
+                logger.info("🎯 Detected Qalia commit signature: '%s' in message: '%s...'", signature, commit_message[:100])
                 return True
         
         # Check commit author
@@ -554,7 +784,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         ]
         
         if author_name in qalia_authors or author_email in qalia_authors:
-            logger.info(f"Detected Qalia commit author: {author_name} <{author_email}>")
+            logger.info("Detected Qalia commit author: %s <%s>", author_name, author_email)
             return True
         
         # Check committer as well
@@ -562,7 +792,7 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         committer_email = commit_info.get("committer", {}).get("email", "")
         
         if committer_name in qalia_authors or committer_email in qalia_authors:
-            logger.info(f"Detected Qalia committer: {committer_name} <{committer_email}>")
+            logger.info("Detected Qalia committer: %s <%s>", committer_name, committer_email)
             return True
         
         # Check if commit only modifies Qalia-related files
@@ -582,29 +812,106 @@ Generated by Qalia.ai on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         
         if all_changed_files:
             if self._are_qalia_only_changes(all_changed_files):
-                logger.info(f"Detected commit with only Qalia-related files: {all_changed_files}")
+                logger.info("Detected commit with only Qalia-related files: %s", all_changed_files)
                 return True
         
         return False
 
 
+def _format_analysis_summary(analysis_results: Dict[str, Any]) -> Tuple[str, str]:
+    """Build the check run title and Markdown summary for analysis results."""
+    frameworks = analysis_results.get("test_frameworks", [])
+    fields = {
+        "status": analysis_results.get("status", "unknown"),
+        "total_tests": analysis_results.get("summary", {}).get("generation_summary", {}).get("total_test_cases", 0),
+        "frameworks": ", ".join(frameworks) if frameworks else "none",
+        "error": analysis_results.get("error"),
+    }
+    
+    summary = ANALYSIS_SUMMARY_TEMPLATE.format_map(fields)
+    if fields["error"]:
+        summary += ANALYSIS_ERROR_TEMPLATE.format_map(fields)
+    
+    return ANALYSIS_TITLE_TEMPLATE.format_map(fields), summary
+
+
+def _rate_limit_wait(response: httpx.Response) -> Optional[float]:
+    """Return the seconds to wait before retrying a rate-limited response, or None if it was not rate limited."""
+    if response.status_code not in (403, 429):
+        return None
+    
+    retry_after = response.headers.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return max(GITHUB_RATE_LIMIT_MIN_WAIT, float(retry_after))
+    
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset and reset.isdigit():
+        return max(GITHUB_RATE_LIMIT_MIN_WAIT, int(reset) - time.time())
+    
+    # Secondary rate limits do not always say when to come back
+    if "rate limit" in response.text.lower():
+        return GITHUB_SECONDARY_RATE_LIMIT_WAIT
+    
+    return None
+
+
+def decode_webhook_signature(signature: str) -> Optional[bytes]:
+    """Decode an X-Hub-Signature-256 header ("sha256=" + 64 hex chars) to raw bytes."""
+    if len(signature) != 71 or not signature.startswith("sha256="):
+        return None
+    try:
+        return binascii.unhexlify(signature[7:])
+    except binascii.Error:
+        return None
+
+
+def _parse_github_timestamp(value: Optional[str]) -> float:
+    """Convert a GitHub ISO-8601 timestamp to epoch seconds (defaults to one hour from now)."""
+    if not value:
+        return time.time() + 3600
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time() + 3600
+
+
+def _read_head_sha(repo_path: Path) -> Optional[str]:
+    """
+    Read the commit SHA checked out in a repository or worktree without spawning git.
+    
+    Args:
+        repo_path: Path to the working tree
+        
+    Returns:
+        The full HEAD commit SHA, or None if it cannot be resolved from loose files
+    """
+    try:
+        git_dir = repo_path / ".git"
+        if git_dir.is_file():
+            # Worktrees have a ".git" file pointing at their private git directory
+            git_dir = repo_path / git_dir.read_text().partition("gitdir:")[2].strip()
+        
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref:"):
+            head = (git_dir / head[4:].strip()).read_text().strip()
+        return head
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
 def get_private_key() -> str:
-    """Read the private key from the PEM file or environment variable."""
+    """Read the private key from the environment or the first PEM file found (once per process)."""
     # Try environment variable first
     env_key = os.getenv("GITHUB_PRIVATE_KEY")
     if env_key:
         return env_key
     
     # Fall back to file
-    try:
-        with open("private-key.pem", "r") as key_file:
-            return key_file.read()
-    except FileNotFoundError:
-        # Try alternative locations
-        try:
-            with open("app/private-key.pem", "r") as key_file:
-                return key_file.read()
-        except FileNotFoundError:
-            raise RuntimeError(
-                "Private key not found. Please ensure private-key.pem exists or set GITHUB_PRIVATE_KEY environment variable."
-            ) 
\ No newline at end of file
+    for key_path in PRIVATE_KEY_PATHS:
+        if key_path.is_file():
+            return key_path.read_text()
+    
+    raise RuntimeError(
+        "Private key not found. Please ensure private-key.pem exists or set GITHUB_PRIVATE_KEY environment variable."
+    )
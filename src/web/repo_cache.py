@@ -0,0 +1,271 @@
+"""
+Repository Cache
+
+Keeps one bare mirror per repository and materializes a lightweight
+``git worktree`` for each analysis run, so webhooks only fetch new objects
+instead of re-cloning the whole repository every time.
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a timed-out git process gets to exit after SIGTERM
+GIT_TERMINATE_GRACE_PERIOD = 2
+
+# Git config key for credentials sent only with HTTPS requests to GitHub
+GITHUB_AUTH_HEADER_KEY = "http.https://github.com/.extraheader"
+
+# Directory removal gets its own small pool so large checkouts being deleted
+# never starve the default executor used by asyncio.to_thread()
+_cleanup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="qalia-cleanup")
+
+
+def git_auth_env(access_token: Optional[str]) -> Dict[str, str]:
+    """
+    Return environment variables that authenticate git with GitHub for one command.
+
+    The token travels as command-scoped config in the environment, so it is
+    never written to a repository's config or visible in the process list.
+    """
+    if not access_token:
+        return {}
+
+    credentials = base64.b64encode(f"x-access-token:{access_token}".encode()).decode()
+    return {
+        "GIT_CONFIG_COUNT": "1",
+        "GIT_CONFIG_KEY_0": GITHUB_AUTH_HEADER_KEY,
+        "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+    }
+
+
+async def run_git(
+    args: List[str],
+    cwd=None,
+    timeout: int = 60,
+    check: bool = False,
+    env: Optional[Dict[str, str]] = None
+) -> subprocess.CompletedProcess:
+    """
+    Run a git command without blocking the event loop, failing fast instead of prompting for credentials.
+
+    Args:
+        args: Arguments passed to git
+        cwd: Working directory for the command
+        timeout: Seconds before the process is terminated
+        check: Raise subprocess.CalledProcessError on a non-zero exit
+        env: Extra environment variables for the command (e.g. git_auth_env())
+
+    Returns:
+        CompletedProcess with decoded stdout and stderr (return code -1 on timeout)
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0", **(env or {})},
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        result = subprocess.CompletedProcess(
+            ["git", *args],
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace")
+        )
+    except asyncio.TimeoutError:
+        # Let git remove its temporary pack files before resorting to SIGKILL
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), GIT_TERMINATE_GRACE_PERIOD)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        result = subprocess.CompletedProcess(["git", *args], -1, "", f"git {args[0]} timed out after {timeout}s")
+
+    if check:
+        result.check_returncode()
+    return result
+
+
+async def remove_tree(path) -> None:
+    """Delete a directory tree without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_cleanup_pool, shutil.rmtree, path, True)
+
+
+class RepoCache:
+    """Manages bare repository mirrors and per-event worktrees."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_mirrors: int = 16,
+        worktree_dir: Optional[str] = None
+    ):
+        """
+        Initialize the repository cache.
+
+        Args:
+            cache_dir: Directory holding the bare mirrors (defaults to
+                QALIA_REPO_CACHE_DIR or a folder in the system temp dir)
+            max_mirrors: Number of mirrors kept on disk before the least
+                recently used idle one is deleted
+            worktree_dir: Directory the per-event worktrees are created in
+                (defaults to QALIA_WORKTREE_DIR or the system temp dir); a
+                tmpfs such as /dev/shm makes checkout and removal memory-only
+        """
+        self.cache_dir = Path(
+            cache_dir
+            or os.getenv("QALIA_REPO_CACHE_DIR")
+            or os.path.join(tempfile.gettempdir(), "qalia-repo-cache")
+        )
+        # Mirrors hold private source code, so keep them readable by this user only
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(self.cache_dir, 0o700)
+        self.worktree_dir = worktree_dir or os.getenv("QALIA_WORKTREE_DIR") or None
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._worktree_repos: Dict[str, str] = {}
+        self.max_mirrors = max_mirrors
+        self._mirror_usage: "OrderedDict[str, None]" = OrderedDict()
+
+    def _mirror_path(self, repo_url: str) -> Path:
+        """Return the on-disk location of the bare mirror for a repository."""
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", repo_url.split("://")[-1]).strip("_")
+        digest = hashlib.sha1(repo_url.encode()).hexdigest()[:8]
+        return self.cache_dir / f"{name[-80:]}-{digest}"
+
+    def _lock_for(self, repo_url: str) -> asyncio.Lock:
+        """Return the lock serializing fetches and worktree changes for a mirror."""
+        if repo_url not in self._locks:
+            self._locks[repo_url] = asyncio.Lock()
+        return self._locks[repo_url]
+
+    async def _git(
+        self,
+        args: List[str],
+        cwd: Optional[Path] = None,
+        timeout: int = 60,
+        env: Optional[Dict[str, str]] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a git command for the cache."""
+        return await run_git(args, cwd=cwd, timeout=timeout, env=env)
+
+    async def checkout(
+        self,
+        repo_url: str,
+        branch: str,
+        commit_sha: Optional[str] = None,
+        access_token: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Fetch a branch into the mirror and create a detached worktree for it.
+
+        Only the branch tip is fetched (shallow, without blobs or tags); the
+        blobs of the checked out tree are downloaded on demand by the worktree.
+
+        Args:
+            repo_url: Repository URL to fetch from, also used as the cache key
+            branch: Branch to fetch
+            commit_sha: Optional commit to check out instead of the branch tip
+            access_token: Optional GitHub token, passed to each git command
+                through git_auth_env() and never stored in the mirror
+
+        Returns:
+            Path to the new worktree or None if failed
+        """
+        mirror = self._mirror_path(repo_url)
+
+        async with self._lock_for(repo_url):
+            if not (mirror / "HEAD").exists():
+                await self._git(["init", "--bare", str(mirror)])
+
+            # Resetting the URL also scrubs credentials older versions stored in it
+            auth_env = git_auth_env(access_token)
+            await self._git(["config", "remote.origin.url", repo_url], cwd=mirror)
+            result = await self._git(
+                [
+                    "fetch", "--depth=1", "--filter=blob:none", "--no-tags", "origin",
+                    f"+refs/heads/{branch}:refs/heads/{branch}"
+                ],
+                cwd=mirror,
+                env=auth_env
+            )
+
+            if result.returncode != 0:
+                logger.error("Failed to update repository mirror: %s", result.stderr)
+                return None
+
+            # Only create the directory once there is something to check out, and
+            # never leak it if the checkout fails or the webhook task is cancelled
+            worktree = tempfile.mkdtemp(prefix="qalia-", dir=self.worktree_dir)
+            try:
+                ref = commit_sha or branch
+                # Checking out downloads the tree's blobs from origin, so it needs the token too
+                result = await self._git(["worktree", "add", "--detach", worktree, ref], cwd=mirror, env=auth_env)
+                if result.returncode != 0 and ref != branch:
+                    # The branch moved past the event's commit; analyze the new tip instead
+                    logger.warning("Commit %s is no longer the tip of %s, using branch head", ref[:8], branch)
+                    ref = branch
+                    result = await self._git(["worktree", "add", "--detach", worktree, ref], cwd=mirror, env=auth_env)
+            except BaseException:
+                await remove_tree(worktree)
+                raise
+
+            if result.returncode != 0:
+                logger.error("Failed to create worktree for %s: %s", ref, result.stderr)
+                await remove_tree(worktree)
+                return None
+
+        self._worktree_repos[worktree] = repo_url
+        self._mirror_usage[repo_url] = None
+        self._mirror_usage.move_to_end(repo_url)
+        logger.info("Created worktree for %s at: %s", ref, worktree)
+
+        await self._evict_mirrors()
+        return worktree
+
+    async def _evict_mirrors(self) -> None:
+        """Delete least recently used mirrors that have no active worktrees."""
+        for repo_url in list(self._mirror_usage):
+            if len(self._mirror_usage) <= self.max_mirrors:
+                break
+
+            async with self._lock_for(repo_url):
+                if repo_url not in self._mirror_usage or repo_url in self._worktree_repos.values():
+                    continue
+                del self._mirror_usage[repo_url]
+                await remove_tree(self._mirror_path(repo_url))
+            logger.info("Evicted repository mirror for %s", repo_url)
+
+    async def release(self, worktree: str) -> None:
+        """Remove a worktree created by checkout()."""
+        repo_url = self._worktree_repos.pop(worktree, None)
+        if repo_url is None:
+            await remove_tree(worktree)
+            return
+
+        mirror = self._mirror_path(repo_url)
+        async with self._lock_for(repo_url):
+            result = await self._git(["worktree", "remove", "--force", worktree], cwd=mirror)
+            if result.returncode != 0:
+                await remove_tree(worktree)
+                await self._git(["worktree", "prune"], cwd=mirror)
+
+    async def close(self) -> None:
+        """Remove all worktrees that are still checked out."""
+        for worktree in list(self._worktree_repos):
+            await self.release(worktree)
@@ -80,8 +80,14 @@ class GitHubOAuth:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        # Shared connection pool for all GitHub requests
+        self.client = httpx.AsyncClient(timeout=30.0)
         logger.info(f"🔐 GitHub OAuth initialized with redirect URI: {redirect_uri}")
     
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self.client.aclose()
+    
     def generate_auth_url(self, state: str) -> str:
         """Generate GitHub OAuth authorization URL with detailed logging"""
         logger.info(f"🔗 Generating GitHub OAuth URL with state: {state[:8]}...")
@@ -125,43 +131,42 @@ class GitHubOAuth:
         logger.info(f"   - redirect_uri: {self.redirect_uri}")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info("🔄 Sending token exchange request to GitHub...")
-                response = await client.post(
-                    "https://github.com/login/oauth/access_token",
-                    headers={"Accept": "application/json"},
-                    data=token_data
+            logger.info("🔄 Sending token exchange request to GitHub...")
+            response = await self.client.post(
+                "https://github.com/login/oauth/access_token",
+                headers={"Accept": "application/json"},
+                data=token_data
+            )
+            
+            logger.info(f"🔄 GitHub token response: {response.status_code}")
+            logger.info(f"🔄 GitHub token response headers: {dict(response.headers)}")
+            
+            if response.status_code != 200:
+                logger.error(f"❌ Token exchange failed: HTTP {response.status_code}")
+                logger.error(f"❌ Response body: {response.text}")
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Failed to exchange code for token: HTTP {response.status_code}"
                 )
-                
-                logger.info(f"🔄 GitHub token response: {response.status_code}")
-                logger.info(f"🔄 GitHub token response headers: {dict(response.headers)}")
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Token exchange failed: HTTP {response.status_code}")
-                    logger.error(f"❌ Response body: {response.text}")
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Failed to exchange code for token: HTTP {response.status_code}"
-                    )
-                
-                response_data = response.json()
-                logger.info(f"🔄 Token exchange response data: {response_data}")
-                
-                if "error" in response_data:
-                    logger.error(f"❌ GitHub OAuth error: {response_data}")
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"GitHub OAuth error: {response_data.get('error_description', response_data.get('error'))}"
-                    )
-                
-                access_token = response_data.get("access_token")
-                if not access_token:
-                    logger.error(f"❌ No access token in response: {response_data}")
-                    raise HTTPException(status_code=400, detail="No access token received from GitHub")
-                
-                logger.info(f"✅ Token exchange successful! Token: {access_token[:8]}...")
-                return access_token
-                
+            
+            response_data = response.json()
+            logger.info(f"🔄 Token exchange response data: {response_data}")
+            
+            if "error" in response_data:
+                logger.error(f"❌ GitHub OAuth error: {response_data}")
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"GitHub OAuth error: {response_data.get('error_description', response_data.get('error'))}"
+                )
+            
+            access_token = response_data.get("access_token")
+            if not access_token:
+                logger.error(f"❌ No access token in response: {response_data}")
+                raise HTTPException(status_code=400, detail="No access token received from GitHub")
+            
+            logger.info(f"✅ Token exchange successful! Token: {access_token[:8]}...")
+            return access_token
+            
         except httpx.TimeoutException:
             logger.error("❌ Token exchange timed out")
             raise HTTPException(status_code=400, detail="Token exchange timed out")
@@ -178,30 +183,29 @@ class GitHubOAuth:
         logger.info(f"👤 Fetching user info with token: {access_token[:8]}...")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info("👤 Sending user info request to GitHub...")
-                response = await client.get(
-                    "https://api.github.com/user",
-                    headers={"Authorization": f"Bearer {access_token}"}
+            logger.info("👤 Sending user info request to GitHub...")
+            response = await self.client.get(
+                "https://api.github.com/user",
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            
+            logger.info(f"👤 GitHub user response: {response.status_code}")
+            logger.info(f"👤 GitHub user response headers: {dict(response.headers)}")
+            
+            if response.status_code != 200:
+                logger.error(f"❌ User info fetch failed: HTTP {response.status_code}")
+                logger.error(f"❌ Response body: {response.text}")
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Failed to get user info: HTTP {response.status_code}"
                 )
-                
-                logger.info(f"👤 GitHub user response: {response.status_code}")
-                logger.info(f"👤 GitHub user response headers: {dict(response.headers)}")
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ User info fetch failed: HTTP {response.status_code}")
-                    logger.error(f"❌ Response body: {response.text}")
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Failed to get user info: HTTP {response.status_code}"
-                    )
-                
-                user_data = response.json()
-                logger.info(f"👤 User data received: {user_data}")
-                logger.info(f"👤 User: {user_data.get('login')} ({user_data.get('name', 'No name')})")
-                
-                return user_data
-                
+            
+            user_data = response.json()
+            logger.info(f"👤 User data received: {user_data}")
+            logger.info(f"👤 User: {user_data.get('login')} ({user_data.get('name', 'No name')})")
+            
+            return user_data
+            
         except httpx.TimeoutException:
             logger.error("❌ User info fetch timed out")
             raise HTTPException(status_code=400, detail="User info fetch timed out")
@@ -215,24 +219,23 @@ class GitHubOAuth:
 
     async def get_user_repositories(self, access_token: str):
         """Get user repositories from GitHub API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.github.com/user/repos",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github.v3+json"
-                },
-                params={
-                    "visibility": "all",
-                    "sort": "updated",
-                    "per_page": 50
-                }
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=400, detail="Failed to fetch repositories")
-            
-            return response.json()
+        response = await self.client.get(
+            "https://api.github.com/user/repos",
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/vnd.github.v3+json"
+            },
+            params={
+                "visibility": "all",
+                "sort": "updated",
+                "per_page": 50
+            }
+        )
+        
+        if response.status_code != 200:
+            raise HTTPException(status_code=400, detail="Failed to fetch repositories")
+        
+        return response.json()
 
 
 def create_session(user_data: Dict[str, Any], access_token: str) -> str:
@@ -332,6 +335,11 @@ app.add_middleware(
 # Initialize GitHub OAuth
 github_oauth = GitHubOAuth(GITHUB_CLIENT_ID, GITHUB_CLIENT_SECRET, GITHUB_REDIRECT_URI)
 
+@app.on_event("shutdown")
+async def close_github_client():
+    """Close the shared GitHub HTTP client on shutdown."""
+    await github_oauth.aclose()
+
 # Active WebSocket connections for recording
 active_connections: Dict[str, WebSocket] = {}
 
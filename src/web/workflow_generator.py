@@ -9,6 +9,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Any
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+
 class WorkflowGenerator:
     """Generates GitHub Actions workflows for running generated tests."""
     
@@ -348,8 +354,9 @@ class WorkflowGenerator:
     
     def _write_workflow(self, path: Path, workflow: Dict[str, Any]) -> None:
         """Write workflow to YAML file."""
-        with open(path, 'w') as f:
-            yaml.dump(workflow, f, default_flow_style=False, sort_keys=False, indent=2)
+        path.write_text(
+            yaml.dump(workflow, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False, indent=2)
+        )
         print(f"✅ Created workflow: {path}")
     
     def create_test_integration_workflow(self, test_dir: str = "qalia-tests") -> Path:
@@ -390,7 +397,8 @@ class WorkflowGenerator:
                     "strategy": {
                         "fail-fast": False,
                         "matrix": {
-                            "framework": ["playwright", "cypress", "jest"]
+                            # Qalia's dispatch names the frameworks it generated tests for
+                            "framework": "${{ github.event.client_payload.frameworks || fromJSON('[\"playwright\", \"cypress\", \"jest\"]') }}"
                         }
                     },
                     "steps": [
@@ -0,0 +1,81 @@
+"""
+Unit tests for the TTL cache used by the webhook server.
+"""
+
+import pytest
+
+from src.web import cache as cache_module
+from src.web.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic in the cache module with a controllable clock."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_before_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("delivery", "payload")
+
+    clock[0] += 9.9
+    assert cache.get("delivery") == "payload"
+    assert "delivery" in cache
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("delivery")
+
+    clock[0] += 10
+    assert cache.get("delivery", "missing") == "missing"
+    assert "delivery" not in cache
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("short", ttl=1)
+    cache.set("long")
+
+    clock[0] += 5
+    assert "short" not in cache
+    assert "long" in cache
+
+
+def test_size_is_bounded_by_evicting_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_reinsertion_refreshes_value_order_and_expiry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    clock[0] += 8
+    cache.set("a", "updated")
+    cache.set("c", 3)
+    assert "b" not in cache
+
+    clock[0] += 8
+    assert cache.get("a") == "updated"
+
+
+def test_pop_removes_entry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    assert len(cache) == 0
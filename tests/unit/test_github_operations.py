@@ -0,0 +1,133 @@
+"""
+Unit tests for GitHub API helpers that need no network access.
+"""
+
+import hashlib
+import hmac
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.web.github_operations import (
+    GITHUB_RATE_LIMIT_MIN_WAIT,
+    GITHUB_SECONDARY_RATE_LIMIT_WAIT,
+    GitHubManager,
+    _rate_limit_wait,
+    decode_webhook_signature,
+)
+
+WEBHOOK_SECRET = "webhook-secret"
+BODY = b'{"action": "opened"}'
+
+
+def sign(body: bytes, secret: str = WEBHOOK_SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def private_key_pem():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+def manager(private_key_pem, tmp_path, monkeypatch):
+    monkeypatch.setenv("QALIA_REPO_CACHE_DIR", str(tmp_path))
+    return GitHubManager("12345", private_key_pem, WEBHOOK_SECRET)
+
+
+def test_successful_response_is_not_rate_limited():
+    assert _rate_limit_wait(httpx.Response(200)) is None
+
+
+def test_forbidden_without_rate_limit_is_not_retried():
+    assert _rate_limit_wait(httpx.Response(403, text="Resource not accessible by integration")) is None
+
+
+def test_retry_after_header_is_honoured():
+    assert _rate_limit_wait(httpx.Response(429, headers={"Retry-After": "17"})) == 17
+
+
+def test_zero_retry_after_is_clamped():
+    assert _rate_limit_wait(httpx.Response(429, headers={"Retry-After": "0"})) == GITHUB_RATE_LIMIT_MIN_WAIT
+
+
+def test_ratelimit_reset_header_is_honoured():
+    response = httpx.Response(403, headers={
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time()) + 30),
+    })
+    assert 28 <= _rate_limit_wait(response) <= 30
+
+
+def test_past_ratelimit_reset_is_clamped():
+    response = httpx.Response(403, headers={
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(time.time()) - 10),
+    })
+    assert _rate_limit_wait(response) == GITHUB_RATE_LIMIT_MIN_WAIT
+
+
+def test_secondary_rate_limit_without_headers_waits_a_minute():
+    response = httpx.Response(403, text="You have exceeded a secondary rate limit")
+    assert _rate_limit_wait(response) == GITHUB_SECONDARY_RATE_LIMIT_WAIT
+
+
+def test_decode_valid_signature():
+    signature = sign(BODY)
+    assert decode_webhook_signature(signature) == bytes.fromhex(signature[7:])
+
+
+@pytest.mark.parametrize("signature", [
+    "",
+    "a" * 64,
+    "sha1=" + "a" * 64,
+    "sha256=" + "a" * 63,
+    "sha256=" + "a" * 66,
+    "sha256=" + "g" * 64,
+])
+def test_decode_rejects_malformed_signature(signature):
+    assert decode_webhook_signature(signature) is None
+
+
+def test_valid_signature_is_accepted(manager):
+    assert manager.verify_webhook_signature(BODY, sign(BODY))
+
+
+@pytest.mark.parametrize("signature", [
+    sign(BODY)[7:],
+    "sha256=" + "z" * 64,
+    sign(BODY, "other-secret"),
+    sign(BODY + b" "),
+])
+def test_invalid_signature_is_rejected(manager, signature):
+    assert not manager.verify_webhook_signature(BODY, signature)
+
+
+def test_streamed_digest_matches_one_shot_signature(manager):
+    hasher = manager.create_signature_hasher()
+    for i in range(0, len(BODY), 4):
+        hasher.update(BODY[i:i + 4])
+
+    assert manager.verify_signature_digest(hasher.digest(), sign(BODY))
+    assert not manager.verify_signature_digest(hasher.digest(), sign(b"tampered"))
+
+
+def test_signature_hashers_do_not_share_state(manager):
+    manager.create_signature_hasher().update(b"leftover")
+    assert manager.verify_webhook_signature(BODY, sign(BODY))
+
+
+def test_verification_is_skipped_without_secret(private_key_pem, tmp_path, monkeypatch):
+    monkeypatch.setenv("QALIA_REPO_CACHE_DIR", str(tmp_path))
+    manager = GitHubManager("12345", private_key_pem)
+
+    assert manager.create_signature_hasher() is None
+    assert manager.verify_webhook_signature(BODY, "")
@@ -0,0 +1,35 @@
+"""
+Unit tests for URL normalization used to deduplicate explored pages.
+"""
+
+from utils.navigation_utils import NavigationUtils
+
+
+def clean(url: str) -> str:
+    return NavigationUtils("https://app.example.com").clean_url(url)
+
+
+def test_trailing_slash_is_ignored():
+    assert clean("https://app.example.com/docs/") == clean("https://app.example.com/docs")
+
+
+def test_root_path_is_kept():
+    assert clean("https://app.example.com") == "https://app.example.com/"
+
+
+def test_query_order_is_ignored():
+    assert clean("https://app.example.com/?b=2&a=1") == clean("https://app.example.com/?a=1&b=2")
+
+
+def test_repeated_query_keys_keep_their_order():
+    assert clean("https://app.example.com/?a=2&a=1") != clean("https://app.example.com/?a=1&a=2")
+
+
+def test_plain_anchor_is_removed():
+    assert clean("https://app.example.com/page#section") == "https://app.example.com/page"
+
+
+def test_route_fragments_are_kept():
+    assert clean("https://app.example.com/#/swap") == "https://app.example.com/#/swap"
+    assert clean("https://app.example.com/#!/pool") == "https://app.example.com/#!/pool"
+    assert clean("https://app.example.com/#/swap") != clean("https://app.example.com/#/pool")
@@ -0,0 +1,52 @@
+"""
+Unit tests for running qalia.yml build and startup commands.
+"""
+
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+# config/__init__.py imports modules that are not part of this tree, so load
+# the module from its file instead of through the package
+_spec = importlib.util.spec_from_file_location(
+    "qalia_config", Path(__file__).resolve().parents[2] / "config" / "qalia_config.py"
+)
+qalia_config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(qalia_config)
+_command_args = qalia_config._command_args
+
+pytestmark = pytest.mark.skipif(
+    os.name != "posix" or shutil.which("python3") is None,
+    reason="commands only bypass the shell on POSIX with python3 on PATH"
+)
+
+
+def test_single_executable_runs_without_shell():
+    assert _command_args("python3 -m http.server 8080") == (["python3", "-m", "http.server", "8080"], False)
+
+
+def test_quoted_arguments_are_split_like_the_shell():
+    assert _command_args('python3 -c "import this"') == (["python3", "-c", "import this"], False)
+
+
+def test_relative_path_runs_without_shell():
+    assert _command_args("./run.sh --port 3000") == (["./run.sh", "--port", "3000"], False)
+
+
+@pytest.mark.parametrize("command", [
+    "cd app && npm start",
+    "source .env; python3 app.py",
+    "npm run build | tee build.log",
+    "python3 app.py > server.log",
+    "PORT=3000 python3 app.py",
+    "cd app",
+    "source .env",
+    "export NODE_ENV=production",
+    "definitely-not-an-installed-program --flag",
+    'python3 -c "unterminated',
+])
+def test_shell_syntax_uses_the_shell(command):
+    assert _command_args(command) == (command, True)
@@ -0,0 +1,129 @@
+"""
+Unit tests for the repository cache, run against local repositories.
+"""
+
+import asyncio
+import base64
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.web import repo_cache as repo_cache_module
+from src.web.repo_cache import GITHUB_AUTH_HEADER_KEY, RepoCache, git_auth_env
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git on PATH")
+
+TOKEN = "ghs_testtoken1234567890"
+
+
+def make_origin(path):
+    """Create a repository with one commit on master and return its file:// URL."""
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=qalia", "-c", "user.email=qalia@example.com", *args],
+            cwd=path, check=True, capture_output=True
+        )
+
+    path.mkdir()
+    git("init", "-q", "-b", "master")
+    # Partial clones need the origin to serve filtered packs
+    git("config", "uploadpack.allowFilter", "true")
+    (path / "README.md").write_text("hello\n")
+    git("add", "README.md")
+    git("commit", "-q", "-m", "initial")
+    return f"file://{path}"
+
+
+def test_git_auth_env_encodes_token_as_basic_auth():
+    env = git_auth_env(TOKEN)
+
+    assert env["GIT_CONFIG_KEY_0"] == GITHUB_AUTH_HEADER_KEY
+    header = env["GIT_CONFIG_VALUE_0"]
+    assert TOKEN not in header
+    encoded = header.rsplit(" ", 1)[1]
+    assert base64.b64decode(encoded).decode() == f"x-access-token:{TOKEN}"
+
+
+def test_git_auth_env_is_empty_without_token():
+    assert git_auth_env(None) == {}
+
+
+def test_checkout_fetches_into_mirror_and_adds_worktree(tmp_path):
+    origin = make_origin(tmp_path / "origin")
+    cache = RepoCache(cache_dir=str(tmp_path / "mirrors"), worktree_dir=str(tmp_path))
+
+    async def scenario():
+        worktree = await cache.checkout(origin, "master")
+        assert worktree is not None
+        assert (tmp_path / "mirrors").stat().st_mode & 0o777 == 0o700
+        assert (cache._mirror_path(origin) / "HEAD").exists()
+        assert (Path(worktree) / "README.md").read_text() == "hello\n"
+
+        await cache.release(worktree)
+        assert not Path(worktree).exists()
+
+    asyncio.run(scenario())
+
+
+def test_checkout_of_unknown_branch_fails_without_leaking_worktree(tmp_path):
+    origin = make_origin(tmp_path / "origin")
+    worktrees = tmp_path / "worktrees"
+    worktrees.mkdir()
+    cache = RepoCache(cache_dir=str(tmp_path / "mirrors"), worktree_dir=str(worktrees))
+
+    assert asyncio.run(cache.checkout(origin, "missing")) is None
+    assert list(worktrees.iterdir()) == []
+
+
+def test_oldest_idle_mirror_is_evicted(tmp_path):
+    first = make_origin(tmp_path / "first")
+    second = make_origin(tmp_path / "second")
+    cache = RepoCache(cache_dir=str(tmp_path / "mirrors"), max_mirrors=1, worktree_dir=str(tmp_path))
+
+    async def scenario():
+        worktree = await cache.checkout(first, "master")
+        await cache.release(worktree)
+
+        second_worktree = await cache.checkout(second, "master")
+        assert not cache._mirror_path(first).exists()
+        assert cache._mirror_path(second).exists()
+
+        # The second mirror still has a worktree, so it outlives the limit
+        first_worktree = await cache.checkout(first, "master")
+        assert second_worktree and first_worktree
+        assert cache._mirror_path(second).exists()
+        await cache.close()
+
+    asyncio.run(scenario())
+
+
+def test_token_never_appears_in_argv_or_mirror_config(tmp_path, monkeypatch):
+    origin = make_origin(tmp_path / "origin")
+    cache = RepoCache(cache_dir=str(tmp_path / "mirrors"), worktree_dir=str(tmp_path))
+    commands = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def recording_exec(*argv, **kwargs):
+        commands.append((argv, kwargs.get("env") or {}))
+        return await create_subprocess_exec(*argv, **kwargs)
+
+    monkeypatch.setattr(repo_cache_module.asyncio, "create_subprocess_exec", recording_exec)
+
+    async def scenario():
+        worktree = await cache.checkout(origin, "master", access_token=TOKEN)
+        assert worktree is not None
+        await cache.release(worktree)
+
+    asyncio.run(scenario())
+
+    assert commands
+    for argv, env in commands:
+        assert not any(TOKEN in arg for arg in argv)
+        assert not any(GITHUB_AUTH_HEADER_KEY in arg for arg in argv)
+    assert any(env.get("GIT_CONFIG_KEY_0") == GITHUB_AUTH_HEADER_KEY for _, env in commands)
+
+    config = (cache._mirror_path(origin) / "config").read_text()
+    assert TOKEN not in config
+    assert "extraheader" not in config